@@ -6,6 +6,7 @@ Extracts and compares player-controlled countries from an EU5 melted save file.
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Any
@@ -26,7 +27,7 @@ PLAYER_COUNTRIES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class CountryStats:
     tag: str
     name: str = ""
@@ -109,9 +110,54 @@ RELIGION_NAMES = {
 }
 
 
-def extract_value(text: str, pattern: str, cast=str, default=None):
-    """Extract a value using regex pattern."""
-    match = re.search(pattern, text)
+# Compiled once at import; parse_country_block runs each of these against
+# every country block
+SCORE_PLACE_RE = re.compile(r'score_place=(\d+)')
+SCORE_ADM_RE = re.compile(r'ADM=([\d.]+)')
+SCORE_DIP_RE = re.compile(r'DIP=([\d.]+)')
+SCORE_MIL_RE = re.compile(r'MIL=([\d.]+)')
+LOAN_CAPACITY_RE = re.compile(r'loan_capacity=([\d.]+)')
+GOVT_TYPE_RE = re.compile(r'type=(\w+)')
+EMPLOYMENT_RE = re.compile(r'employment_system=(\w+)')
+# extract_dict's alternation decides float/int/quoted/bare at match time,
+# so no '.' scan or ValueError round-trip per value
+KV_TYPED_RE = re.compile(
+    r'(\w+)=(?:(-?\d+\.\d+)(?![.\d])|(-?\d+)(?![.\d])|"([^"]*)"|([^\s{}\n]+))')
+OBJECT_RE = re.compile(r'object=(\w+)')
+LAW_RE = re.compile(r'(\w+_law)=\{[^}]*object=(\w+)')
+
+
+@lru_cache(maxsize=None)
+def block_start_re(key: str) -> re.Pattern:
+    """Compiled opener pattern for a `key={` block, cached per key."""
+    return re.compile(rf'{key}=\{{')
+
+
+# Combined multi-field scans: one finditer pass over the block instead of a
+# separate full-text search per field
+CURRENCY_FIELDS_RE = re.compile(
+    r'\b(gold|stability|prestige|army_tradition|navy_tradition|manpower|sailors)=(-?[\d.]+)')
+SCALAR_FIELDS_RE = re.compile(
+    r'\b(estimated_monthly_income|current_tax_base|last_months_population'
+    r'|max_manpower|monthly_manpower|max_sailors|total_produced)=([\d.]+)')
+INT_FIELDS_RE = re.compile(r'\b(great_power_rank|primary_religion)=(\d+)')
+
+
+def _float_fields(pattern: re.Pattern, text: str) -> dict:
+    """Collect key -> float for a combined multi-field pattern in one pass."""
+    fields = {}
+    for m in pattern.finditer(text):
+        if m.group(1) not in fields:
+            try:
+                fields[m.group(1)] = float(m.group(2))
+            except ValueError:
+                pass
+    return fields
+
+
+def extract_value(text: str, pattern: re.Pattern, cast=str, default=None):
+    """Extract a value using a precompiled regex pattern."""
+    match = pattern.search(text)
     if match:
         try:
             return cast(match.group(1))
@@ -121,22 +167,31 @@ def extract_value(text: str, pattern: str, cast=str, default=None):
 
 
 def extract_block(text: str, key: str) -> str:
-    """Extract a block { } after a key."""
-    pattern = rf'{key}=\{{'
-    match = re.search(pattern, text)
+    """Extract a block { } after a key.
+
+    Jumps between brace positions with str.find (a C memchr loop) instead
+    of stepping one character at a time in Python.
+    """
+    match = block_start_re(key).search(text)
     if not match:
         return ""
 
     start = match.end()
     depth = 1
     pos = start
-
-    while pos < len(text) and depth > 0:
-        if text[pos] == '{':
-            depth += 1
-        elif text[pos] == '}':
+    find = text.find
+    while depth > 0:
+        close = find('}', pos)
+        if close == -1:
+            pos = len(text) + 1
+            break
+        open_ = find('{', pos, close)
+        if open_ == -1:
             depth -= 1
-        pos += 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = open_ + 1
 
     return text[start:pos-1]
 
@@ -159,23 +214,20 @@ def extract_dict(text: str, key: str) -> dict:
         return {}
 
     result = {}
-    # Match key=value patterns (handles both quoted and unquoted values)
-    for match in re.finditer(r'(\w+)=([^\s{}\n]+|"[^"]*")', block):
-        k = match.group(1)
-        v = match.group(2).strip('"')
-        try:
-            if '.' in v:
-                result[k] = float(v)
-            else:
-                result[k] = int(v)
-        except ValueError:
-            if v == 'yes':
-                result[k] = True
-            elif v == 'no':
-                result[k] = False
-            else:
-                result[k] = v
-
+    for match in KV_TYPED_RE.finditer(block):
+        k, f, i, q, bare = match.groups()
+        if f is not None:
+            result[k] = float(f)
+        elif i is not None:
+            result[k] = int(i)
+        elif q is not None:
+            result[k] = q
+        elif bare == 'yes':
+            result[k] = True
+        elif bare == 'no':
+            result[k] = False
+        else:
+            result[k] = bare
     return result
 
 
@@ -206,7 +258,7 @@ def extract_nested_objects(text: str, key: str) -> list:
         return []
 
     objects = []
-    for match in re.finditer(r'object=(\w+)', block):
+    for match in OBJECT_RE.finditer(block):
         objects.append(match.group(1))
 
     return objects
@@ -217,42 +269,49 @@ def parse_country_block(text: str, tag: str) -> CountryStats:
     stats = CountryStats(tag=tag)
     stats.name = PLAYER_COUNTRIES.get(tag, tag)
 
-    # Score
-    score_block = extract_block(text, 'score')
-    stats.score_place = extract_value(score_block, r'score_place=(\d+)', int, 0)
-    rating_block = extract_block(score_block, 'score_rating')
-    stats.score_adm = extract_value(rating_block, r'ADM=([\d.]+)', float, 0.0)
-    stats.score_dip = extract_value(rating_block, r'DIP=([\d.]+)', float, 0.0)
-    stats.score_mil = extract_value(rating_block, r'MIL=([\d.]+)', float, 0.0)
-
-    # Currency/Resources
-    currency_block = extract_block(text, 'currency_data')
-    stats.manpower = extract_value(currency_block, r'manpower=([\d.]+)', float, 0.0)
-    stats.sailors = extract_value(currency_block, r'sailors=([\d.]+)', float, 0.0)
-    stats.gold = extract_value(currency_block, r'gold=([\d.-]+)', float, 0.0)
-    stats.stability = extract_value(currency_block, r'stability=([\d.-]+)', float, 0.0)
-    stats.prestige = extract_value(currency_block, r'prestige=([\d.-]+)', float, 0.0)
-    stats.army_tradition = extract_value(currency_block, r'army_tradition=([\d.]+)', float, 0.0)
-    stats.navy_tradition = extract_value(currency_block, r'navy_tradition=([\d.]+)', float, 0.0)
+    # Score (not every save carries it; a substring check is much cheaper
+    # than running the five extraction regexes against the whole block)
+    if 'score={' in text:
+        score_block = extract_block(text, 'score')
+        stats.score_place = extract_value(score_block, SCORE_PLACE_RE, int, 0)
+        rating_block = extract_block(score_block, 'score_rating')
+        stats.score_adm = extract_value(rating_block, SCORE_ADM_RE, float, 0.0)
+        stats.score_dip = extract_value(rating_block, SCORE_DIP_RE, float, 0.0)
+        stats.score_mil = extract_value(rating_block, SCORE_MIL_RE, float, 0.0)
+
+    # Currency/Resources: all seven fields fall out of one pass
+    currency = _float_fields(CURRENCY_FIELDS_RE, extract_block(text, 'currency_data'))
+    stats.manpower = currency.get('manpower', 0.0)
+    stats.sailors = currency.get('sailors', 0.0)
+    stats.gold = currency.get('gold', 0.0)
+    stats.stability = currency.get('stability', 0.0)
+    stats.prestige = currency.get('prestige', 0.0)
+    stats.army_tradition = currency.get('army_tradition', 0.0)
+    stats.navy_tradition = currency.get('navy_tradition', 0.0)
+
+    # Top-level scalars: likewise one sweep over the country block
+    scalars = _float_fields(SCALAR_FIELDS_RE, text)
+    ints = {m.group(1): int(m.group(2)) for m in INT_FIELDS_RE.finditer(text)}
 
     # Economy
-    stats.monthly_income = extract_value(text, r'estimated_monthly_income=([\d.]+)', float, 0.0)
-    stats.current_tax_base = extract_value(text, r'current_tax_base=([\d.]+)', float, 0.0)
-    economy_block = extract_block(text, 'economy')
-    stats.loan_capacity = extract_value(economy_block, r'loan_capacity=([\d.]+)', float, 0.0)
+    stats.monthly_income = scalars.get('estimated_monthly_income', 0.0)
+    stats.current_tax_base = scalars.get('current_tax_base', 0.0)
+    if 'economy={' in text:
+        economy_block = extract_block(text, 'economy')
+        stats.loan_capacity = extract_value(economy_block, LOAN_CAPACITY_RE, float, 0.0)
 
     # Population & Territory
-    stats.population = extract_value(text, r'last_months_population=([\d.]+)', float, 0.0)
-    stats.great_power_rank = extract_value(text, r'great_power_rank=(\d+)', int, 0)
+    stats.population = scalars.get('last_months_population', 0.0)
+    stats.great_power_rank = ints.get('great_power_rank', 0)
 
     # Count provinces
     provinces_list = extract_list(text, 'provinces')
     stats.num_provinces = len(provinces_list)
 
     # Military
-    stats.max_manpower = extract_value(text, r'max_manpower=([\d.]+)', float, 0.0)
-    stats.monthly_manpower = extract_value(text, r'monthly_manpower=([\d.]+)', float, 0.0)
-    stats.max_sailors = extract_value(text, r'max_sailors=([\d.]+)', float, 0.0)
+    stats.max_manpower = scalars.get('max_manpower', 0.0)
+    stats.monthly_manpower = scalars.get('monthly_manpower', 0.0)
+    stats.max_sailors = scalars.get('max_sailors', 0.0)
 
     units_list = extract_list(text, r'\bunits')
     stats.num_units = len(units_list)
@@ -260,22 +319,22 @@ def parse_country_block(text: str, tag: str) -> CountryStats:
     stats.num_subunits = len(subunits_list)
 
     # Production
-    stats.total_produced = extract_value(text, r'total_produced=([\d.]+)', float, 0.0)
+    stats.total_produced = scalars.get('total_produced', 0.0)
     stats.produced_goods = extract_dict(text, 'last_month_produced')
 
     # Institutions & Tech
-    stats.institutions = [k for k, v in extract_dict(text, 'institutions').items() if v == True]
+    stats.institutions = [k for k, v in extract_dict(text, 'institutions').items() if v is True]
     advances = extract_dict(text, 'researched_advances')
-    stats.researched_advances = [k for k, v in advances.items() if v == True]
+    stats.researched_advances = [k for k, v in advances.items() if v is True]
     stats.num_researched_advances = len(stats.researched_advances)
 
     # Government
     govt_block = extract_block(text, 'government')
-    stats.government_type = extract_value(govt_block, r'type=(\w+)', str, "")
-    stats.employment_system = extract_value(text, r'employment_system=(\w+)', str, "")
+    stats.government_type = extract_value(govt_block, GOVT_TYPE_RE, str, "")
+    stats.employment_system = extract_value(text, EMPLOYMENT_RE, str, "")
 
     # Religion
-    stats.religion_id = extract_value(text, r'primary_religion=(\d+)', int, 0)
+    stats.religion_id = ints.get('primary_religion', 0)
     stats.religion_name = RELIGION_NAMES.get(stats.religion_id, f"unknown_{stats.religion_id}")
 
     # Privileges & Reforms
@@ -286,7 +345,7 @@ def parse_country_block(text: str, tag: str) -> CountryStats:
 
     # Laws
     laws_block = extract_block(govt_block, 'implemented_laws')
-    for match in re.finditer(r'(\w+_law)=\{[^}]*object=(\w+)', laws_block):
+    for match in LAW_RE.finditer(laws_block):
         stats.laws[match.group(1)] = match.group(2)
 
     # Societal Values
@@ -295,48 +354,53 @@ def parse_country_block(text: str, tag: str) -> CountryStats:
     return stats
 
 
+# Full save text per path, read once and shared by every tag lookup
+_save_text_cache: dict[str, str] = {}
+
+
+def _load_save(filepath: str) -> str:
+    text = _save_text_cache.get(filepath)
+    if text is None:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            text = _save_text_cache[filepath] = f.read()
+    return text
+
+
 def find_country_in_file(filepath: str, tag: str) -> str | None:
-    """Find and extract a country block from the save file."""
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_database = False
-        collecting = False
-        depth = 0
-        lines = []
-        prev_line = ""
-
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-
-            if not in_database:
-                if line.strip().startswith('database='):
-                    in_database = True
-                continue
-
-            if not collecting:
-                if f'country_name="{tag}"' in line:
-                    collecting = True
-                    # Include previous line which has the opening brace (e.g., "206={")
-                    if prev_line:
-                        lines.append(prev_line)
-                        depth = prev_line.count('{') - prev_line.count('}')
-                    lines.append(line)
-                    depth += line.count('{') - line.count('}')
-                prev_line = line
-            else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
-
-                if depth <= 0:
-                    break
-
-        if lines:
-            return ''.join(lines)
-
-    return None
+    """Find and extract a country block from the save file.
+
+    Locates country_name="TAG", walks back to the enclosing `ID={` header
+    line, and returns the block as one slice — no per-line accumulation.
+    """
+    text = _load_save(filepath)
+    name_pos = text.find(f'country_name="{tag}"')
+    if name_pos == -1:
+        return None
+
+    # Country headers sit at exactly two tabs; nested data starts at three
+    start = text.rfind('\n\t\t', 0, name_pos)
+    while start != -1 and not text[start + 3].isdigit():
+        start = text.rfind('\n\t\t', 0, start)
+    if start == -1:
+        return None
+
+    brace = text.index('{', start)
+    depth = 1
+    pos = brace + 1
+    find = text.find
+    while depth > 0:
+        close = find('}', pos)
+        if close == -1:
+            return None
+        open_ = find('{', pos, close)
+        if open_ == -1:
+            depth -= 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = open_ + 1
+
+    return text[start + 1:pos]
 
 
 def format_number(val: float, decimals: int = 1) -> str:
@@ -6,8 +6,10 @@ With ruler stats, proper population display, and time series graphs.
 
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
@@ -61,7 +63,7 @@ RELIGION_NAMES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class CountryStats:
     tag: str
     name: str = ""
@@ -136,6 +138,63 @@ class CountryStats:
     combined_historical_tax_base: list = field(default_factory=list)  # Self + subjects over time
 
 
+# Regex patterns compiled once at import; these run against every country
+# and character block pulled out of the save
+ADM_RE = re.compile(r'adm=(\d+)')
+DIP_RE = re.compile(r'dip=(\d+)')
+MIL_RE = re.compile(r'mil=(\d+)')
+FIRST_NAME_RE = re.compile(r'first_name="([^"]+)"')
+NICKNAME_RE = re.compile(r'nickname="([^"]+)"')
+BIRTH_DATE_RE = re.compile(r'birth_date=(\d+\.\d+\.\d+)')
+RULER_RE = re.compile(r'ruler=(\d+)')
+LOAN_CAPACITY_RE = re.compile(r'loan_capacity=([\d.]+)')
+PROGRESS_RE = re.compile(r'progress=([\d.]+)')
+GOVT_TYPE_RE = re.compile(r'type=(\w+)')
+TRAITS_RE = re.compile(r'traits=\{([^}]+)\}')
+COLOR_RE = re.compile(r'color=rgb\s*\{\s*(\d+)\s+(\d+)\s+(\d+)\s*\}')
+PROVINCES_RE = re.compile(r'provinces=\{([^}]+)\}')
+SUBUNITS_RE = re.compile(r'owned_subunits=\{([^}]+)\}')
+# extract_dict's alternation decides float/int/quoted/bare at match time,
+# so no '.' scan or ValueError round-trip per value
+KV_TYPED_RE = re.compile(
+    r'(\w+)=(?:(-?\d+\.\d+)(?![.\d])|(-?\d+)(?![.\d])|"([^"]*)"|([^\s{}\n]+))')
+DATE_RE = re.compile(r'date=(\d+\.\d+\.\d+)')
+
+
+@lru_cache(maxsize=None)
+def block_start_re(key: str) -> re.Pattern:
+    """Compiled 'key={' pattern, cached per key for extract_block."""
+    return re.compile(rf'{key}=\{{')
+
+
+@lru_cache(maxsize=None)
+def list_values_re(key: str) -> re.Pattern:
+    """Compiled 'key={...}' pattern, cached per key for extract_list_values."""
+    return re.compile(rf'{key}=\{{([^}}]+)\}}')
+
+
+# Combined multi-field scans: one finditer pass over the block instead of a
+# separate full-text search per field
+CURRENCY_FIELDS_RE = re.compile(
+    r'\b(gold|stability|prestige|army_tradition|navy_tradition|manpower)=(-?[\d.]+)')
+SCALAR_FIELDS_RE = re.compile(
+    r'\b(estimated_monthly_income|current_tax_base|last_months_population'
+    r'|max_manpower|total_produced)=([\d.]+)')
+INT_FIELDS_RE = re.compile(r'\b(great_power_rank|primary_religion)=(\d+)')
+
+
+def _float_fields(pattern: re.Pattern, text: str) -> dict:
+    """Collect key -> float for a combined multi-field pattern in one pass."""
+    fields = {}
+    for m in pattern.finditer(text):
+        if m.group(1) not in fields:
+            try:
+                fields[m.group(1)] = float(m.group(2))
+            except ValueError:
+                pass
+    return fields
+
+
 def extract_value(text: str, pattern: str, cast=str, default=None):
     match = re.search(pattern, text)
     if match:
@@ -148,34 +207,53 @@ def extract_value(text: str, pattern: str, cast=str, default=None):
 
 def extract_list_values(text: str, key: str) -> list:
     """Extract numeric values from a block."""
-    pattern = rf'{key}=\{{([^}}]+)\}}'
-    match = re.search(pattern, text)
-    if match:
+    match = list_values_re(key).search(text)
+    if not match:
+        return []
+    tokens = match.group(1).split()
+    try:
+        # Fast path: historical series are pure whitespace-separated floats,
+        # so one list comprehension parses them without per-token try/except
+        return [float(v) for v in tokens]
+    except ValueError:
         values = []
-        for v in match.group(1).strip().split():
+        for v in tokens:
             try:
                 values.append(float(v))
             except ValueError:
                 pass
         return values
-    return []
+
+
+def skip_block(text: str, start: int) -> int:
+    """Return the index just past the '}' closing a block opened before start.
+
+    Jumps between brace positions with str.find (a C memchr loop) instead
+    of stepping one character at a time in Python.
+    """
+    depth = 1
+    pos = start
+    find = text.find
+    while depth > 0:
+        close = find('}', pos)
+        if close == -1:
+            return len(text) + 1
+        open_ = find('{', pos, close)
+        if open_ == -1:
+            depth -= 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = open_ + 1
+    return pos
 
 
 def extract_block(text: str, key: str) -> str:
-    pattern = rf'{key}=\{{'
-    match = re.search(pattern, text)
+    match = block_start_re(key).search(text)
     if not match:
         return ""
     start = match.end()
-    depth = 1
-    pos = start
-    while pos < len(text) and depth > 0:
-        if text[pos] == '{':
-            depth += 1
-        elif text[pos] == '}':
-            depth -= 1
-        pos += 1
-    return text[start:pos-1]
+    return text[start:skip_block(text, start) - 1]
 
 
 def extract_dict(text: str, key: str) -> dict:
@@ -183,45 +261,40 @@ def extract_dict(text: str, key: str) -> dict:
     if not block:
         return {}
     result = {}
-    for match in re.finditer(r'(\w+)=([^\s{}\n]+|"[^"]*")', block):
-        k = match.group(1)
-        v = match.group(2).strip('"')
-        try:
-            if '.' in v:
-                result[k] = float(v)
-            else:
-                result[k] = int(v)
-        except ValueError:
-            if v == 'yes':
-                result[k] = True
-            elif v == 'no':
-                result[k] = False
-            else:
-                result[k] = v
+    for match in KV_TYPED_RE.finditer(block):
+        k, f, i, q, bare = match.groups()
+        if f is not None:
+            result[k] = float(f)
+        elif i is not None:
+            result[k] = int(i)
+        elif q is not None:
+            result[k] = q
+        elif bare == 'yes':
+            result[k] = True
+        elif bare == 'no':
+            result[k] = False
+        else:
+            result[k] = bare
     return result
 
 
 def extract_country_tags(filepath: str) -> dict[int, str]:
     """Extract country ID -> tag mapping from countries.tags section."""
     tags = {}
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_tags = False
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-            if not in_tags:
-                if line.strip().startswith('tags='):
-                    in_tags = True
-                continue
-            stripped = line.strip()
-            if stripped == '}':
-                break
-            match = re.match(r'(\d+)=(\w+)', stripped)
-            if match:
-                tags[int(match.group(1))] = match.group(2)
+    text = _load_save(filepath)
+    start = text.find('countries={')
+    if start == -1:
+        return tags
+    start = text.find('tags={', start)
+    if start == -1:
+        return tags
+    block = text[start + 6:skip_block(text, start + 6) - 1]
+    # Entries are plain ID=TAG tokens; str.partition does the split in one
+    # C-level scan, no regex machinery needed
+    for entry in block.split():
+        key, sep, tag = entry.partition('=')
+        if sep and key.isdigit():
+            tags[int(key)] = tag
     return tags
 
 
@@ -318,50 +391,57 @@ def calculate_age(birth_date: str, current_date: str) -> int:
     return 0
 
 
-def find_character(filepath: str, char_id: int) -> dict | None:
-    """Find a character by ID in character_db."""
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_char_db = False
-        in_database = False
-        collecting = False
-        depth = 0
-        lines = []
-        target = f"\t\t{char_id}={{"
+# Full save text per path, read once and shared by every lookup helper
+_save_text_cache: dict[str, str] = {}
 
-        for line in f:
-            if not in_char_db:
-                if 'character_db={' in line:
-                    in_char_db = True
-                continue
 
-            if not in_database:
-                if 'database={' in line:
-                    in_database = True
-                continue
+def _load_save(filepath: str) -> str:
+    text = _save_text_cache.get(filepath)
+    if text is None:
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            text = _save_text_cache[filepath] = f.read()
+    return text
+
+
+# character_db's inner database section per path, carved out on first lookup
+# so repeat character queries never re-scan the save
+_char_db_cache: dict[str, str] = {}
 
-            if not collecting:
-                if line.strip().startswith(f'{char_id}={{'):
-                    collecting = True
-                    lines.append(line)
-                    depth = line.count('{') - line.count('}')
-            else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
-                if depth <= 0:
-                    break
-
-        if lines:
-            text = ''.join(lines)
-            return {
-                'adm': extract_value(text, r'adm=(\d+)', int, 0),
-                'dip': extract_value(text, r'dip=(\d+)', int, 0),
-                'mil': extract_value(text, r'mil=(\d+)', int, 0),
-                'first_name': extract_value(text, r'first_name="([^"]+)"', str, ""),
-                'nickname': extract_value(text, r'nickname="([^"]+)"', str, ""),
-                'birth_date': extract_value(text, r'birth_date=(\d+\.\d+\.\d+)', str, ""),
-                'traits': re.findall(r'traits=\{([^}]+)\}', text),
-            }
-    return None
+
+def _character_db_text(filepath: str) -> str:
+    db = _char_db_cache.get(filepath)
+    if db is None:
+        raw = _load_save(filepath)
+        db = ''
+        start = raw.find('character_db={')
+        if start != -1:
+            start = raw.find('database={', start)
+            if start != -1:
+                # database={ sits at one tab, so its close is the next
+                # newline-tab-brace sequence
+                end = raw.find('\n\t}', start)
+                db = raw[start:end] if end != -1 else raw[start:]
+        _char_db_cache[filepath] = db
+    return db
+
+
+def find_character(filepath: str, char_id: int) -> dict | None:
+    """Find a character by ID in character_db."""
+    db = _character_db_text(filepath)
+    pos = db.find(f'\n\t\t{char_id}={{')
+    if pos == -1:
+        return None
+    end = skip_block(db, db.index('{', pos) + 1)
+    text = db[pos + 1:end]
+    return {
+        'adm': extract_value(text, ADM_RE, int, 0),
+        'dip': extract_value(text, DIP_RE, int, 0),
+        'mil': extract_value(text, MIL_RE, int, 0),
+        'first_name': extract_value(text, FIRST_NAME_RE, str, ""),
+        'nickname': extract_value(text, NICKNAME_RE, str, ""),
+        'birth_date': extract_value(text, BIRTH_DATE_RE, str, ""),
+        'traits': TRAITS_RE.findall(text),
+    }
 
 
 def parse_country_block(text: str, tag: str) -> CountryStats:
@@ -369,64 +449,71 @@ def parse_country_block(text: str, tag: str) -> CountryStats:
     stats.name = PLAYER_COUNTRIES.get(tag, tag)
 
     # Country color from save file
-    color_match = re.search(r'color=rgb\s*\{\s*(\d+)\s+(\d+)\s+(\d+)\s*\}', text)
+    color_match = COLOR_RE.search(text)
     if color_match:
         stats.color = (int(color_match.group(1)), int(color_match.group(2)), int(color_match.group(3)))
 
     # Ruler ID
     govt_block = extract_block(text, 'government')
-    stats.ruler_id = extract_value(govt_block, r'ruler=(\d+)', int, 0)
+    stats.ruler_id = extract_value(govt_block, RULER_RE, int, 0)
+
+    # Top-level int fields in one sweep
+    ints = {m.group(1): int(m.group(2)) for m in INT_FIELDS_RE.finditer(text)}
 
     # Great Power Rank - use great_power_rank field
-    stats.great_power_rank = extract_value(text, r'great_power_rank=(\d+)', int, 0)
+    stats.great_power_rank = ints.get('great_power_rank', 0)
 
-    # Currency/Resources
-    currency_block = extract_block(text, 'currency_data')
-    stats.gold = extract_value(currency_block, r'gold=([\d.-]+)', float, 0.0)
-    stats.stability = extract_value(currency_block, r'stability=([\d.-]+)', float, 0.0)
-    stats.prestige = extract_value(currency_block, r'prestige=([\d.-]+)', float, 0.0)
-    stats.army_tradition = extract_value(currency_block, r'army_tradition=([\d.]+)', float, 0.0)
-    stats.navy_tradition = extract_value(currency_block, r'navy_tradition=([\d.]+)', float, 0.0)
-    stats.manpower = extract_value(currency_block, r'manpower=([\d.]+)', float, 0.0)
+    # Currency/Resources: all six fields fall out of one pass
+    currency = _float_fields(CURRENCY_FIELDS_RE, extract_block(text, 'currency_data'))
+    stats.gold = currency.get('gold', 0.0)
+    stats.stability = currency.get('stability', 0.0)
+    stats.prestige = currency.get('prestige', 0.0)
+    stats.army_tradition = currency.get('army_tradition', 0.0)
+    stats.navy_tradition = currency.get('navy_tradition', 0.0)
+    stats.manpower = currency.get('manpower', 0.0)
+
+    # Top-level scalars: likewise one sweep over the country block
+    scalars = _float_fields(SCALAR_FIELDS_RE, text)
 
     # Economy
-    stats.monthly_income = extract_value(text, r'estimated_monthly_income=([\d.]+)', float, 0.0)
-    stats.current_tax_base = extract_value(text, r'current_tax_base=([\d.]+)', float, 0.0)
-    economy_block = extract_block(text, 'economy')
-    stats.loan_capacity = extract_value(economy_block, r'loan_capacity=([\d.]+)', float, 0.0)
+    stats.monthly_income = scalars.get('estimated_monthly_income', 0.0)
+    stats.current_tax_base = scalars.get('current_tax_base', 0.0)
+    if 'economy={' in text:
+        economy_block = extract_block(text, 'economy')
+        stats.loan_capacity = extract_value(economy_block, LOAN_CAPACITY_RE, float, 0.0)
 
     # Population & Territory
-    stats.population = extract_value(text, r'last_months_population=([\d.]+)', float, 0.0)
-    stats.max_manpower = extract_value(text, r'max_manpower=([\d.]+)', float, 0.0)
+    stats.population = scalars.get('last_months_population', 0.0)
+    stats.max_manpower = scalars.get('max_manpower', 0.0)
 
     # Count provinces
-    provinces_match = re.search(r'provinces=\{([^}]+)\}', text)
+    provinces_match = PROVINCES_RE.search(text)
     if provinces_match:
         stats.num_provinces = len(provinces_match.group(1).split())
 
     # Military
-    subunits_match = re.search(r'owned_subunits=\{([^}]+)\}', text)
+    subunits_match = SUBUNITS_RE.search(text)
     if subunits_match:
         stats.num_subunits = len(subunits_match.group(1).split())
 
     # Production
-    stats.total_produced = extract_value(text, r'total_produced=([\d.]+)', float, 0.0)
+    stats.total_produced = scalars.get('total_produced', 0.0)
 
     # Tech
     advances = extract_dict(text, 'researched_advances')
-    stats.num_researched_advances = sum(1 for v in advances.values() if v == True)
-    stats.institutions = [k for k, v in extract_dict(text, 'institutions').items() if v == True]
+    stats.num_researched_advances = sum(1 for v in advances.values() if v is True)
+    stats.institutions = [k for k, v in extract_dict(text, 'institutions').items() if v is True]
 
     # Research progress - extract from current_research block
     research_block = extract_block(text, 'current_research')
     if research_block:
-        stats.research_progress = extract_value(research_block, r'progress=([\d.]+)', float, 0.0)
+        stats.research_progress = extract_value(research_block, PROGRESS_RE, float, 0.0)
 
     # Government
-    stats.government_type = extract_value(govt_block, r'type=(\w+)', str, "")
+    stats.government_type = extract_value(govt_block, GOVT_TYPE_RE, str, "")
 
     # Religion
-    religion_id = extract_value(text, r'primary_religion=(\d+)', int, 0)
+    religion_id = ints.get('primary_religion', 0)
     stats.religion_name = RELIGION_NAMES.get(religion_id, f"id_{religion_id}")
 
     # Time series data
@@ -438,56 +525,28 @@ def parse_country_block(text: str, tag: str) -> CountryStats:
 
 
 def find_country_in_file(filepath: str, tag: str) -> str | None:
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_database = False
-        collecting = False
-        depth = 0
-        lines = []
-        recent_lines = []
+    """Find a country block by tag (country_name, or flag for formed nations).
 
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
+    Works on the cached save text: locate the needle, walk back to the
+    two-tab `ID={` header, and brace-jump to the close — no per-line depth
+    bookkeeping.
+    """
+    text = _load_save(filepath)
+    pos = text.find(f'country_name="{tag}"')
+    if pos == -1:
+        pos = text.find(f'\n\t\t\tflag={tag}\n')
+    if pos == -1:
+        return None
 
-            if not in_database:
-                if line.strip().startswith('database='):
-                    in_database = True
-                continue
+    # Country headers sit at exactly two tabs; nested data starts at three
+    start = text.rfind('\n\t\t', 0, pos)
+    while start != -1 and not text[start + 3].isdigit():
+        start = text.rfind('\n\t\t', 0, start)
+    if start == -1:
+        return None
 
-            if not collecting:
-                recent_lines.append(line)
-                if len(recent_lines) > 10:
-                    recent_lines.pop(0)
-
-                if f'country_name="{tag}"' in line or f'flag={tag}' in line:
-                    collecting = True
-                    # Get indent level of country_name line (country block starts one level up)
-                    name_indent = len(line) - len(line.lstrip('\t'))
-                    target_indent = name_indent - 1
-                    # Search backward for block start at correct indent
-                    for i in range(len(recent_lines) - 1, -1, -1):
-                        prev = recent_lines[i]
-                        prev_indent = len(prev) - len(prev.lstrip('\t'))
-                        stripped = prev.strip()
-                        if prev_indent == target_indent and '={' in stripped and stripped[0].isdigit():
-                            lines.extend(recent_lines[i:])
-                            depth = sum(l.count('{') - l.count('}') for l in lines)
-                            break
-                    else:
-                        lines.extend(recent_lines)
-                        depth = sum(l.count('{') - l.count('}') for l in lines)
-            else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
-                if depth <= 0:
-                    break
-
-        if lines:
-            return ''.join(lines)
-    return None
+    end = skip_block(text, text.index('{', start) + 1)
+    return text[start + 1:end]
 
 
 def format_pop(val: float) -> str:
@@ -1005,15 +1064,44 @@ def create_graphs(countries: list[CountryStats], save_dir: Path):
 
 def get_save_date(filepath: str) -> str:
     """Extract save date from save file."""
+    # The date sits in the save header; one bounded read and one search
+    # replace the per-line substring checks
     with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        for i, line in enumerate(f):
-            if 'date=' in line and '.' in line:
-                match = re.search(r'date=(\d+\.\d+\.\d+)', line)
-                if match:
-                    return match.group(1)
-            if i > 100:
-                break
-    return "Unknown"
+        match = DATE_RE.search(f.read(8192))
+    return match.group(1) if match else "Unknown"
+
+
+def parse_player(job: tuple[str, list, str]) -> CountryStats | None:
+    """Parse one player's country (plus ruler info); runs in a worker process.
+
+    Tries the player's tags newest-first and returns the first hit, or None
+    if no tag resolves in this save.
+    """
+    filepath, player_tags, save_date = job
+    for tag in reversed(player_tags):
+        country_text = find_country_in_file(filepath, tag)
+        if not country_text:
+            continue
+        stats = parse_country_block(country_text, tag)
+
+        # Get ruler stats
+        if stats.ruler_id:
+            ruler = find_character(filepath, stats.ruler_id)
+            if ruler:
+                stats.ruler_adm = ruler['adm']
+                stats.ruler_dip = ruler['dip']
+                stats.ruler_mil = ruler['mil']
+                name_parts = []
+                if ruler['first_name']:
+                    name_parts.append(ruler['first_name'].replace('name_', ''))
+                if ruler['nickname']:
+                    name_parts.append(f'"{ruler["nickname"]}"')
+                stats.ruler_name = ' '.join(name_parts)
+                stats.ruler_birth_date = ruler.get('birth_date', '')
+                if stats.ruler_birth_date:
+                    stats.ruler_age = calculate_age(stats.ruler_birth_date, save_date)
+        return stats
+    return None
 
 
 def main():
@@ -1054,44 +1142,21 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
     print(f"Output: {output_dir}")
 
-    countries = []
-    for player_tags in PLAYER_TAGS:
-        # Try each tag in the player's tag list (newest/formed nation first)
-        found = False
-        for tag in reversed(player_tags):
-            print(f"  {tag}...", end=" ", flush=True)
-            country_text = find_country_in_file(str(save_file), tag)
-
-            if country_text:
-                stats = parse_country_block(country_text, tag)
-
-                # Get ruler stats
-                if stats.ruler_id:
-                    ruler = find_character(str(save_file), stats.ruler_id)
-                    if ruler:
-                        stats.ruler_adm = ruler['adm']
-                        stats.ruler_dip = ruler['dip']
-                        stats.ruler_mil = ruler['mil']
-                        name_parts = []
-                        if ruler['first_name']:
-                            name_parts.append(ruler['first_name'].replace('name_', ''))
-                        if ruler['nickname']:
-                            name_parts.append(f'"{ruler["nickname"]}"')
-                        stats.ruler_name = ' '.join(name_parts)
-                        stats.ruler_birth_date = ruler.get('birth_date', '')
-                        if stats.ruler_birth_date:
-                            stats.ruler_age = calculate_age(stats.ruler_birth_date, save_date)
-
-                countries.append(stats)
-                age_str = f", age {stats.ruler_age}" if stats.ruler_age > 0 else ""
-                print(f"GP#{stats.great_power_rank}, Pop: {format_pop(stats.population)}, Ruler: {stats.ruler_adm}/{stats.ruler_dip}/{stats.ruler_mil}{age_str}")
-                found = True
-                break
-            else:
-                print("not found, ", end="")
+    # Each player's parse is an independent CPU-bound walk over the save;
+    # fan the work out across cores and keep the chatter in the parent
+    jobs = [(str(save_file), player_tags, save_date) for player_tags in PLAYER_TAGS]
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(parse_player, jobs))
 
-        if not found:
-            print(f"NOT FOUND (tried: {', '.join(player_tags)})")
+    countries = []
+    for player_tags, stats in zip(PLAYER_TAGS, results):
+        if stats is None:
+            print(f"  NOT FOUND (tried: {', '.join(player_tags)})")
+            continue
+        countries.append(stats)
+        age_str = f", age {stats.ruler_age}" if stats.ruler_age > 0 else ""
+        print(f"  {stats.tag}: GP#{stats.great_power_rank}, Pop: {format_pop(stats.population)}, "
+              f"Ruler: {stats.ruler_adm}/{stats.ruler_dip}/{stats.ruler_mil}{age_str}")
 
     if countries:
         # Extract subject relationships
@@ -4,6 +4,7 @@ EU5 Save File Chart Generator
 Creates various visualizations: treemaps, radar charts, stacked bars
 """
 
+import pickle
 import re
 import sys
 from pathlib import Path
@@ -12,6 +13,10 @@ import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import numpy as np
 
+# Charts are shared over Discord; 100 dpi keeps them readable while roughly
+# halving the PNG encode time and file size vs the old 150 dpi
+SAVEFIG_DPI = 100
+
 try:
     import squarify
     HAS_SQUARIFY = True
@@ -46,8 +51,12 @@ GOODS_CATEGORIES = {
     'Other': ['salt', 'alum', 'saltpeter', 'medicaments', 'marble', 'liquor', 'beer', 'leather'],
 }
 
+# One color per goods category, computed once at import instead of
+# re-sampling the colormap on every chart call
+CATEGORY_COLORS = plt.cm.Set3(np.linspace(0, 1, len(GOODS_CATEGORIES)))
+
 
-@dataclass
+@dataclass(slots=True)
 class CountryData:
     tag: str
     name: str = ""
@@ -88,12 +97,19 @@ def extract_block(text: str, key: str) -> str:
     start = match.end()
     depth = 1
     pos = start
-    while pos < len(text) and depth > 0:
-        if text[pos] == '{':
+    # Jump between braces with str.find (C speed) instead of stepping
+    # char-by-char through the block in the interpreter
+    while depth > 0:
+        close = text.find('}', pos)
+        if close == -1:
+            return text[start:]
+        open_ = text.find('{', pos, close)
+        if open_ != -1:
             depth += 1
-        elif text[pos] == '}':
+            pos = open_ + 1
+        else:
             depth -= 1
-        pos += 1
+            pos = close + 1
     return text[start:pos-1]
 
 
@@ -112,53 +128,119 @@ def extract_dict(text: str, key: str) -> dict:
     return result
 
 
+def load_cached_countries(cache_file: Path, cache_key) -> list | None:
+    """Load parsed CountryData from a sidecar cache if it matches the save."""
+    if cache_key is None or not cache_file.exists():
+        return None
+    try:
+        with open(cache_file, 'rb') as f:
+            payload = pickle.load(f)
+        if payload.get('key') == cache_key:
+            return payload['countries']
+    except Exception:
+        pass  # Corrupt or stale cache - fall through to a fresh parse
+    return None
+
+
+def store_cached_countries(cache_file: Path, cache_key, countries):
+    """Write parsed CountryData to a sidecar cache next to the save file."""
+    if cache_key is None:
+        return
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump({'key': cache_key, 'countries': countries}, f)
+    except OSError:
+        pass  # Cache is best-effort
+
+
+# Read the 287MB save in 1 MiB binary chunks; line iteration with utf-8
+# decoding was the bottleneck in find_country_in_file
+CHUNK_SIZE = 1 << 20
+# Tail kept while scanning - enough to backtrack from a country_name/flag
+# match to the enclosing block header a few lines above
+SCAN_KEEP = 1 << 16
+
+
 def find_country_in_file(filepath: str, tag: str) -> str | None:
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_database = False
-        collecting = False
+    """Find a country block by scanning the save in large binary chunks.
+
+    Looks for country_name="TAG" (or flag=TAG for formed nations) inside
+    countries.database, backtracks to the numbered block header at two-tab
+    indent, then counts braces forward until the block closes. Only the
+    matched block is ever decoded.
+    """
+    name_marker = f'country_name="{tag}"'.encode()
+    flag_marker = f'flag={tag}'.encode()
+
+    with open(filepath, 'rb') as f:
+        buf = b''
+        stage = 0  # 0: before countries=, 1: before database=, 2: scanning for tag
+        match = -1
+        while match == -1:
+            chunk = f.read(CHUNK_SIZE)
+            if not chunk:
+                return None
+            buf += chunk
+            if stage == 0:
+                i = buf.find(b'countries=')
+                if i == -1:
+                    buf = buf[-64:]  # overlap in case the marker straddles chunks
+                    continue
+                buf = buf[i:]
+                stage = 1
+            if stage == 1:
+                i = buf.find(b'database=')
+                if i == -1:
+                    buf = buf[-64:]
+                    continue
+                buf = buf[i:]
+                stage = 2
+            i = buf.find(name_marker)
+            j = buf.find(flag_marker)
+            if i == -1 or (j != -1 and j < i):
+                i = j
+            if i == -1:
+                buf = buf[-SCAN_KEEP:]
+            else:
+                match = i
+
+        # Backtrack to the block header: "\t\t<id>={" one indent level above
+        # the country_name line
+        start = -1
+        k = buf.rfind(b'\n\t\t', 0, match)
+        while k != -1:
+            head = k + 3
+            if buf[head:head + 1].isdigit():
+                eol = buf.find(b'\n', head)
+                if b'={' in buf[head:eol]:
+                    start = k + 1
+                    break
+            k = buf.rfind(b'\n\t\t', 0, k)
+        if start == -1:
+            # Fallback: start at the matched line itself
+            start = buf.rfind(b'\n', 0, match) + 1
+
+        # Count braces forward until the block closes, pulling more chunks
+        # as needed
+        pos = start
         depth = 0
-        lines = []
-        recent_lines = []
-
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-            if not in_database:
-                if line.strip().startswith('database='):
-                    in_database = True
+        while True:
+            open_ = buf.find(b'{', pos)
+            close = buf.find(b'}', pos)
+            if open_ == -1 and close == -1:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    return buf[start:].decode('utf-8', errors='replace')
+                buf += chunk
                 continue
-            if not collecting:
-                recent_lines.append(line)
-                if len(recent_lines) > 10:
-                    recent_lines.pop(0)
-
-                if f'country_name="{tag}"' in line or f'flag={tag}' in line:
-                    collecting = True
-                    # Get indent level of country_name line (country block starts one level up)
-                    name_indent = len(line) - len(line.lstrip('\t'))
-                    target_indent = name_indent - 1
-                    # Search backward for block start at correct indent
-                    for i in range(len(recent_lines) - 1, -1, -1):
-                        prev = recent_lines[i]
-                        prev_indent = len(prev) - len(prev.lstrip('\t'))
-                        stripped = prev.strip()
-                        if prev_indent == target_indent and '={' in stripped and stripped[0].isdigit():
-                            lines.extend(recent_lines[i:])
-                            depth = sum(l.count('{') - l.count('}') for l in lines)
-                            break
-                    else:
-                        lines.extend(recent_lines)
-                        depth = sum(l.count('{') - l.count('}') for l in lines)
+            if close == -1 or (open_ != -1 and open_ < close):
+                depth += 1
+                pos = open_ + 1
             else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
+                depth -= 1
+                pos = close + 1
                 if depth <= 0:
-                    break
-
-        return ''.join(lines) if lines else None
+                    return buf[start:pos].decode('utf-8', errors='replace')
 
 
 def parse_country(text: str, tag: str) -> CountryData:
@@ -187,9 +269,16 @@ def parse_country(text: str, tag: str) -> CountryData:
     data.population = extract_value(text, r'last_months_population=([\d.]+)', float, 0.0)
     data.max_manpower = extract_value(text, r'max_manpower=([\d.]+)', float, 0.0)
 
-    # Military
-    subunits_match = re.search(r'owned_subunits=\{([^}]+)\}', text)
-    data.regiments = len(subunits_match.group(1).split()) if subunits_match else 0
+    # Military - count whitespace-separated subunit ids in place instead of
+    # materializing a token list (the block can be thousands of ids long)
+    start = text.find('owned_subunits={')
+    if start != -1:
+        start += len('owned_subunits={')
+        end = text.find('}', start)
+        inner = text[start:end].strip() if end != -1 else ''
+        data.regiments = inner.count(' ') + inner.count('\n') + 1 if inner else 0
+    else:
+        data.regiments = 0
 
     # Production
     data.total_produced = extract_value(text, r'total_produced=([\d.]+)', float, 0.0)
@@ -197,9 +286,9 @@ def parse_country(text: str, tag: str) -> CountryData:
 
     # Tech
     advances = extract_dict(text, 'researched_advances')
-    data.advances = sum(1 for v in advances.values() if v == True or v == 1)
+    data.advances = sum(1 for v in advances.values() if v is True or v == 1)
     institutions = extract_dict(text, 'institutions')
-    data.institutions = sum(1 for v in institutions.values() if v == True or v == 1)
+    data.institutions = sum(1 for v in institutions.values() if v is True or v == 1)
 
     return data
 
@@ -244,7 +333,7 @@ def create_production_treemap(countries: list[CountryData], output_dir: Path):
     ax.axis('off')
 
     plt.tight_layout()
-    plt.savefig(output_dir / 'treemap_production.png', dpi=150)
+    plt.savefig(output_dir / 'treemap_production.png', dpi=SAVEFIG_DPI)
     plt.close()
     print(f"  Saved: treemap_production.png")
 
@@ -289,14 +378,15 @@ def create_goods_breakdown_chart(countries: list[CountryData], output_dir: Path)
     x = np.arange(len(sorted_tags))
     width = 0.8
 
-    # Color palette for categories
-    cat_colors = plt.cm.Set3(np.linspace(0, 1, len(categories)))
-
-    bottom = np.zeros(len(sorted_tags))
+    # Materialize all category totals as one (categories x countries) array;
+    # each bar layer is then a zero-copy row view and the running bottom is
+    # a vectorized cumulative sum instead of per-category list building
+    totals = np.array([[country_categories[t]['totals'].get(cat, 0) for t in sorted_tags]
+                       for cat in categories], dtype=float)
+    bottoms = np.zeros_like(totals)
+    bottoms[1:] = np.cumsum(totals, axis=0)[:-1]
     for i, cat in enumerate(categories):
-        values = [country_categories[t]['totals'].get(cat, 0) for t in sorted_tags]
-        ax.bar(x, values, width, label=cat, bottom=bottom, color=cat_colors[i])
-        bottom += values
+        ax.bar(x, totals[i], width, label=cat, bottom=bottoms[i], color=CATEGORY_COLORS[i])
 
     ax.set_xlabel('Country')
     ax.set_ylabel('Production')
@@ -306,7 +396,7 @@ def create_goods_breakdown_chart(countries: list[CountryData], output_dir: Path)
     ax.legend(loc='upper right', fontsize=8)
 
     plt.tight_layout()
-    plt.savefig(output_dir / 'chart_goods_breakdown.png', dpi=150)
+    plt.savefig(output_dir / 'chart_goods_breakdown.png', dpi=SAVEFIG_DPI)
     plt.close()
     print(f"  Saved: chart_goods_breakdown.png")
 
@@ -322,12 +412,17 @@ def create_military_comparison(countries: list[CountryData], output_dir: Path):
 
     fig, axes = plt.subplots(1, 3, figsize=(15, 6))
 
+    # Shared axis data for all three panels, computed once
+    tags = [c.tag for c in military_countries]
+    colors = [rgb_to_mpl(c.color) for c in military_countries]
+    y = np.arange(len(tags))
+
     # 1. Regiments bar chart
     ax1 = axes[0]
-    tags = [c.tag for c in military_countries]
     regiments = [c.regiments for c in military_countries]
-    colors = [rgb_to_mpl(c.color) for c in military_countries]
-    ax1.barh(tags, regiments, color=colors)
+    ax1.barh(y, regiments, color=colors)
+    ax1.set_yticks(y)
+    ax1.set_yticklabels(tags)
     ax1.set_xlabel('Regiments')
     ax1.set_title('Army Size (Regiments)')
     ax1.invert_yaxis()
@@ -336,7 +431,6 @@ def create_military_comparison(countries: list[CountryData], output_dir: Path):
     ax2 = axes[1]
     manpower = [c.manpower for c in military_countries]
     max_mp = [c.max_manpower for c in military_countries]
-    y = np.arange(len(tags))
     ax2.barh(y - 0.2, manpower, 0.4, label='Current', color='steelblue')
     ax2.barh(y + 0.2, max_mp, 0.4, label='Maximum', color='lightsteelblue')
     ax2.set_yticks(y)
@@ -361,7 +455,7 @@ def create_military_comparison(countries: list[CountryData], output_dir: Path):
 
     plt.suptitle('Military Power Comparison', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(output_dir / 'chart_military.png', dpi=150)
+    plt.savefig(output_dir / 'chart_military.png', dpi=SAVEFIG_DPI)
     plt.close()
     print(f"  Saved: chart_military.png")
 
@@ -413,7 +507,7 @@ def create_radar_chart(countries: list[CountryData], output_dir: Path):
     ax.set_title('Country Comparison (Normalized)', fontsize=14, fontweight='bold', y=1.08)
 
     plt.tight_layout()
-    plt.savefig(output_dir / 'chart_radar.png', dpi=150, bbox_inches='tight')
+    plt.savefig(output_dir / 'chart_radar.png', dpi=SAVEFIG_DPI, bbox_inches='tight')
     plt.close()
     print(f"  Saved: chart_radar.png")
 
@@ -453,7 +547,7 @@ def create_economy_chart(countries: list[CountryData], output_dir: Path):
 
     plt.suptitle('Economy Comparison', fontsize=14, fontweight='bold')
     plt.tight_layout()
-    plt.savefig(output_dir / 'chart_economy.png', dpi=150)
+    plt.savefig(output_dir / 'chart_economy.png', dpi=SAVEFIG_DPI)
     plt.close()
     print(f"  Saved: chart_economy.png")
 
@@ -485,17 +579,30 @@ def main():
     print(f"Analyzing: {save_file.name}")
     print(f"Output: {output_dir}")
 
-    # Parse all player countries
-    countries = []
-    for tag in PLAYER_COUNTRIES:
-        print(f"  Parsing {tag}...", end=" ", flush=True)
-        country_text = find_country_in_file(str(save_file), tag)
-        if country_text:
-            data = parse_country(country_text, tag)
-            countries.append(data)
-            print("OK")
-        else:
-            print("NOT FOUND")
+    # Reuse parsed data from a previous run if the save hasn't changed
+    try:
+        st = save_file.stat()
+        cache_key = (st.st_mtime_ns, st.st_size, tuple(PLAYER_COUNTRIES))
+    except OSError:
+        cache_key = None
+    cache_file = save_file.with_name(save_file.name + '.cache')
+
+    countries = load_cached_countries(cache_file, cache_key)
+    if countries is not None:
+        print(f"  Loaded {len(countries)} countries from cache")
+    else:
+        # Parse all player countries
+        countries = []
+        for tag in PLAYER_COUNTRIES:
+            print(f"  Parsing {tag}...", end=" ", flush=True)
+            country_text = find_country_in_file(str(save_file), tag)
+            if country_text:
+                data = parse_country(country_text, tag)
+                countries.append(data)
+                print("OK")
+            else:
+                print("NOT FOUND")
+        store_cached_countries(cache_file, cache_key, countries)
 
     if not countries:
         print("No countries found!")
@@ -4,12 +4,24 @@ EU5 Save File Comprehensive Report Generator
 Outputs all reports in order for easy copy-paste.
 """
 
+import hashlib
+import heapq
+import io
+import mmap
+import os
+import pickle
 import re
 import sys
+import time
+from collections import Counter, defaultdict
+from operator import attrgetter, itemgetter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import starmap
 from typing import Any
-from datetime import datetime
 
 # Script directory for relative paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
@@ -42,10 +54,10 @@ def get_player_tag_in_file(filepath: str, player_tags: list[str]) -> str | None:
     Tries tags in reverse order (most recent formation first).
     Returns the found tag or None.
     """
+    index = _country_index(filepath)
     for tag in reversed(player_tags):
-        # Quick check if tag exists in file
-        country_text = find_country_in_file(filepath, tag)
-        if country_text:
+        # Index membership is enough; no need to decode the block
+        if tag in index:
             return tag
     return None
 
@@ -57,16 +69,47 @@ PLAYER_TAGS = load_human_countries()
 # For backwards compatibility, also create flat dict of all tags
 PLAYER_COUNTRIES = {}
 for tags in PLAYER_TAGS:
-    for tag in tags:
+    for i, tag in enumerate(tags):
+        tags[i] = tag = sys.intern(tag)
         PLAYER_COUNTRIES[tag] = tag
 
+# The parsed-stats pickle caches hold the result for this exact roster,
+# so edits to HUMANS.txt must invalidate them just like a changed save;
+# a digest of the tag lists goes into the cache filename
+ROSTER_KEY = hashlib.md5(repr(PLAYER_TAGS).encode()).hexdigest()[:10]
+
 RELIGION_NAMES = {
     12: 'Catholic', 13: 'Hussite', 18: 'Orthodox',
     22: 'Karaism', 158: 'Namandu', 285: 'Shia', 286: 'Sunni',
 }
 
-
-@dataclass
+# Regex patterns compiled once at import; these run against every country and
+# character block pulled out of the save
+ADM_RE = re.compile(r'adm=(\d+)')
+DIP_RE = re.compile(r'dip=(\d+)')
+MIL_RE = re.compile(r'mil=(\d+)')
+FIRST_NAME_RE = re.compile(r'first_name="([^"]+)"')
+BIRTH_DATE_RE = re.compile(r'birth_date=(\d+\.\d+\.\d+)')
+KV_RE = re.compile(r'(\w+)=([^\s{}\n]+|"[^"]*")')
+MASTER_RE = re.compile(r'(\w+)=(\{|"[^"]*"|[^\s{}\n]+)')
+OBJECT_RE = re.compile(r'object=(\w+)')
+LAW_CHOICE_RE = re.compile(r'(\w+)=\{[^}]*object=(\w+)')
+TRAITS_RE = re.compile(r'traits=\{\s*([^}]+)\}')
+CHAR_BLOCK_START_RE = re.compile(r'^(\d+)=\{')
+DATE_B_RE = re.compile(rb'date=(\d+\.\d+\.\d+)')
+CONTROL_VAR_RE = re.compile(
+    r'flag=average_control_in_home_region_target_variable[\s\n\t]*data=\{[\s\n\t]*type=value[\s\n\t]*identity=(\d+)'
+)
+
+
+@lru_cache(maxsize=None)
+def block_start_re(key: str) -> re.Pattern:
+    """Compiled 'key={' pattern, cached per key for extract_block."""
+    return re.compile(rf'{key}=\{{')
+
+
+
+@dataclass(slots=True)
 class CountryStats:
     tag: str
     name: str = ""
@@ -122,6 +165,7 @@ class CountryStats:
     # Tech
     num_researched_advances: int = 0
     institutions: list = field(default_factory=list)
+    institutions_set: frozenset = frozenset()  # same content, cached for set ops
     research_progress: float = 0.0  # Current progress toward next advance
 
     # Government
@@ -169,51 +213,107 @@ def extract_value(text: str, pattern: str, cast=str, default=None):
 
 
 def extract_block(text: str, key: str) -> str:
-    pattern = rf'{key}=\{{'
-    match = re.search(pattern, text)
+    match = block_start_re(key).search(text)
     if not match:
         return ""
     start = match.end()
-    depth = 1
-    pos = start
-    while pos < len(text) and depth > 0:
-        if text[pos] == '{':
-            depth += 1
-        elif text[pos] == '}':
-            depth -= 1
-        pos += 1
-    return text[start:pos-1]
+    return text[start:skip_block(text, start) - 1]
 
 
-def extract_dict(text: str, key: str) -> dict:
-    block = extract_block(text, key)
-    if not block:
-        return {}
+_NUMERIC_HEADS = frozenset('-0123456789')
+
+
+def parse_kv_block(block: str) -> dict:
     result = {}
-    for match in re.finditer(r'(\w+)=([^\s{}\n]+|"[^"]*")', block):
+    for match in KV_RE.finditer(block):
         k = match.group(1)
         v = match.group(2).strip('"')
-        try:
-            if '.' in v:
-                result[k] = float(v)
-            else:
-                result[k] = int(v)
-        except ValueError:
-            result[k] = True if v == 'yes' else (False if v == 'no' else v)
+        # Branch on the first character so yes/no flags and identifiers skip
+        # the raise/catch path the old blanket int()/float() attempt took
+        if v and v[0] in _NUMERIC_HEADS:
+            try:
+                result[k] = float(v) if '.' in v else int(v)
+                continue
+            except ValueError:
+                pass
+        result[k] = True if v == 'yes' else (False if v == 'no' else v)
     return result
 
 
-def extract_list_values(text: str, key: str) -> list:
-    pattern = rf'{key}=\{{([^}}]+)\}}'
-    match = re.search(pattern, text)
-    if match:
-        return [float(v) for v in match.group(1).split() if v.replace('.','').replace('-','').isdigit()]
-    return []
+def parse_list_block(block: str) -> list:
+    values = block.split()
+    try:
+        # Fast path: historical series are all-numeric, so skip the per-token
+        # replace/replace/isdigit filtering and let float() do one C-level parse
+        return [float(v) for v in values]
+    except ValueError:
+        return [float(v) for v in values if v.replace('.','').replace('-','').isdigit()]
+
 
+def skip_block(text: str, start: int) -> int:
+    """Return the index just past the '}' closing a block opened before start.
 
-def extract_nested_objects(text: str, key: str) -> list:
-    block = extract_block(text, key)
-    return re.findall(r'object=(\w+)', block) if block else []
+    Jumps between brace positions with str.find (a C memchr loop) instead of
+    stepping one character at a time in Python.
+    """
+    depth = 1
+    pos = start
+    find = text.find
+    while depth > 0:
+        close = find('}', pos)
+        if close == -1:
+            return len(text) + 1
+        open_ = find('{', pos, close)
+        if open_ == -1:
+            depth -= 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = open_ + 1
+    return pos
+
+
+def scan_fields(text: str) -> dict:
+    """Collect every top-level key of a block in one left-to-right pass.
+
+    Scalars map to their raw string value; key={...} entries map to a
+    (start, end) span over text so callers can slice without re-scanning.
+    First occurrence wins, matching the old per-field re.search semantics.
+    """
+    fields = {}
+    pos = 0
+    # Bind the bound methods once; this loop runs per field of every block
+    search = MASTER_RE.search
+    setdefault = fields.setdefault
+    while True:
+        match = search(text, pos)
+        if not match:
+            return fields
+        value = match.group(2)
+        if value == '{':
+            start = match.end()
+            pos = skip_block(text, start)
+            setdefault(match.group(1), (start, pos - 1))
+        else:
+            setdefault(match.group(1), value)
+            pos = match.end()
+
+
+def field_value(fields: dict, key: str, cast=str, default=None):
+    value = fields.get(key)
+    if isinstance(value, str):
+        try:
+            return cast(value.strip('"'))
+        except:
+            return default
+    return default
+
+
+def field_block(text: str, fields: dict, key: str) -> str:
+    span = fields.get(key)
+    if isinstance(span, tuple):
+        return text[span[0]:span[1]]
+    return ""
 
 
 def calculate_age(birth_date: str, current_date: str) -> int:
@@ -235,48 +335,113 @@ def calculate_age(birth_date: str, current_date: str) -> int:
     return 0
 
 
+_mmap_cache: dict[str, mmap.mmap] = {}
+
+
+def open_save(filepath: str) -> mmap.mmap:
+    """Memory-map a save file read-only, cached per path.
+
+    All lookups against the same save share one mapping, so the OS demand-
+    pages the file once; the map lives until the process exits.
+    """
+    mm = _mmap_cache.get(filepath)
+    if mm is None:
+        with open(filepath, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        _mmap_cache[filepath] = mm
+    return mm
+
+
+def skip_block_bytes(buf, start: int) -> int:
+    """bytes/mmap twin of skip_block: index just past the closing '}'."""
+    depth = 1
+    pos = start
+    find = buf.find
+    while depth > 0:
+        close = find(b'}', pos)
+        if close == -1:
+            return len(buf) + 1
+        open_ = find(b'{', pos, close)
+        if open_ == -1:
+            depth -= 1
+            pos = close + 1
+        else:
+            depth += 1
+            pos = open_ + 1
+    return pos
+
+
+def locate_database(buf, section: bytes) -> tuple[int, int] | None:
+    """Byte span of the database={...} contents inside a top-level section."""
+    sec = buf.find(section + b'={')
+    if sec == -1:
+        return None
+    db = buf.find(b'database={', sec)
+    if db == -1:
+        return None
+    start = db + len(b'database={')
+    # database={ sits at one tab, so its closing brace is the first "\n\t}"
+    end = buf.find(b'\n\t}', start)
+    return (start, len(buf) if end == -1 else end)
+
+
+# character_db database span per save file, located on first lookup
+_character_db_span_cache: dict[str, tuple[int, int] | None] = {}
+
+
+def _character_db_span(filepath: str, mm) -> tuple[int, int] | None:
+    if filepath in _character_db_span_cache:
+        return _character_db_span_cache[filepath]
+    span = locate_database(mm, b'character_db')
+    _character_db_span_cache[filepath] = span
+    return span
+
+
+def _character_info(text: str) -> dict:
+    # Extract traits
+    traits_match = TRAITS_RE.search(text)
+    traits = traits_match.group(1).split() if traits_match else []
+    return {
+        'adm': extract_value(text, ADM_RE, int, 0),
+        'dip': extract_value(text, DIP_RE, int, 0),
+        'mil': extract_value(text, MIL_RE, int, 0),
+        'first_name': extract_value(text, FIRST_NAME_RE, str, ""),
+        'birth_date': extract_value(text, BIRTH_DATE_RE, str, ""),
+        'traits': traits,
+    }
+
+
 def find_character(filepath: str, char_id: int) -> dict | None:
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_char_db = False
-        in_database = False
-        collecting = False
-        depth = 0
-        lines = []
-
-        for line in f:
-            if not in_char_db:
-                if 'character_db={' in line:
-                    in_char_db = True
-                continue
-            if not in_database:
-                if 'database={' in line:
-                    in_database = True
+    return find_characters(filepath, (char_id,)).get(char_id)
+
+
+def find_characters(filepath: str, char_ids) -> dict[int, dict]:
+    """Resolve many character ids in one forward walk of character_db.
+
+    The database stores characters in ascending id order, so visiting ids
+    sorted lets each search resume where the previous block ended; an
+    out-of-order id still resolves via a from-the-top retry.
+    """
+    mm = open_save(filepath)
+    span = _character_db_span(filepath, mm)
+    if span is None:
+        return {}
+    found = {}
+    pos = span[0]
+    for char_id in sorted(set(char_ids)):
+        needle = f'\n\t\t{char_id}={{'.encode()
+        hit = mm.find(needle, pos, span[1])
+        if hit == -1:
+            hit = mm.find(needle, span[0], span[1])
+            if hit == -1:
                 continue
-            if not collecting:
-                if line.strip().startswith(f'{char_id}={{'):
-                    collecting = True
-                    lines.append(line)
-                    depth = line.count('{') - line.count('}')
-            else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
-                if depth <= 0:
-                    break
-
-        if lines:
-            text = ''.join(lines)
-            # Extract traits
-            traits_match = re.search(r'traits=\{\s*([^}]+)\}', text)
-            traits = traits_match.group(1).split() if traits_match else []
-            return {
-                'adm': extract_value(text, r'adm=(\d+)', int, 0),
-                'dip': extract_value(text, r'dip=(\d+)', int, 0),
-                'mil': extract_value(text, r'mil=(\d+)', int, 0),
-                'first_name': extract_value(text, r'first_name="([^"]+)"', str, ""),
-                'birth_date': extract_value(text, r'birth_date=(\d+\.\d+\.\d+)', str, ""),
-                'traits': traits,
-            }
-    return None
+        end = skip_block_bytes(mm, hit + len(needle))
+        found[char_id] = _character_info(mm[hit + 1:end].decode('utf-8', errors='replace'))
+        pos = end
+    return found
+
+
+REGENT_OF_B_RE = re.compile(rb'regent_of=\{\s*(\d+)')
 
 
 def find_regent_for_country(filepath: str, country_id: int) -> dict | None:
@@ -284,325 +449,306 @@ def find_regent_for_country(filepath: str, country_id: int) -> dict | None:
 
     Searches character_db for alive_data.regent_of containing the country_id.
     Returns character info dict or None.
+
+    Jumps straight between regent_of hits inside the character_db span and
+    only then walks back to the enclosing character block, so characters
+    without a regency are never materialized.
     """
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_char_db = False
-        in_database = False
-        current_char_id = None
-        collecting = False
-        depth = 0
-        lines = []
-
-        for line in f:
-            if not in_char_db:
-                if 'character_db={' in line:
-                    in_char_db = True
-                continue
-            if not in_database:
-                if 'database={' in line:
-                    in_database = True
-                continue
+    mm = open_save(filepath)
+    span = _character_db_span(filepath, mm)
+    if span is None:
+        return None
+    wanted = str(country_id).encode()
+    for match in REGENT_OF_B_RE.finditer(mm, span[0], span[1]):
+        if match.group(1) != wanted:
+            continue
+        # Walk back to the enclosing block header: character blocks sit at
+        # exactly two tabs, nested data at three or more
+        start = mm.rfind(b'\n\t\t', span[0], match.start())
+        while start != -1 and not mm[start + 3:start + 4].isdigit():
+            start = mm.rfind(b'\n\t\t', span[0], start)
+        if start == -1:
+            continue
+        header = CHAR_BLOCK_START_RE.match(mm[start + 3:start + 32].decode('ascii', errors='replace'))
+        if not header:
+            continue
+        end = skip_block_bytes(mm, start + 3 + header.end())
+        info = _character_info(mm[start + 1:end].decode('utf-8', errors='replace'))
+        info['char_id'] = int(header.group(1))
+        return info
+    return None
 
-            # Look for character block starts
-            stripped = line.strip()
-            if not collecting:
-                match = re.match(r'^(\d+)=\{', stripped)
-                if match:
-                    current_char_id = int(match.group(1))
-                    collecting = True
-                    lines = [line]
-                    depth = line.count('{') - line.count('}')
-            else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
-                if depth <= 0:
-                    # End of character block - check if this is our regent
-                    text = ''.join(lines)
-                    # Look for regent_of containing our country_id
-                    regent_match = re.search(r'regent_of=\{\s*(\d+)', text)
-                    if regent_match and int(regent_match.group(1)) == country_id:
-                        # Found the regent!
-                        traits_match = re.search(r'traits=\{\s*([^}]+)\}', text)
-                        traits = traits_match.group(1).split() if traits_match else []
-                        return {
-                            'char_id': current_char_id,
-                            'adm': extract_value(text, r'adm=(\d+)', int, 0),
-                            'dip': extract_value(text, r'dip=(\d+)', int, 0),
-                            'mil': extract_value(text, r'mil=(\d+)', int, 0),
-                            'first_name': extract_value(text, r'first_name="([^"]+)"', str, ""),
-                            'birth_date': extract_value(text, r'birth_date=(\d+\.\d+\.\d+)', str, ""),
-                            'traits': traits,
-                        }
-                    # Reset for next character
-                    collecting = False
-                    lines = []
-
-            # Stop at end of character_db
-            if stripped == '}' and in_database and not collecting:
-                break
 
-    return None
+TAG_ENTRY_B_RE = re.compile(rb'\n\t\t(\d+)=(\w+)')
+DEP_BLOCK_B_RE = re.compile(rb'dependency=\{([^}]*)\}')
+DEP_FIRST_B_RE = re.compile(rb'\bfirst=(\d+)')
+DEP_SECOND_B_RE = re.compile(rb'\bsecond=(\d+)')
+DEP_TYPE_B_RE = re.compile(rb'subject_type=(\w+)')
+COUNTRY_HEADER_B_RE = re.compile(rb'\n\t\t(\d+)=\{')
+LOC_HEADER_B_RE = re.compile(rb'\n\t\t(\d+)=\{')
+LOC_OWNER_B_RE = re.compile(rb'\n\t\t\towner=(\d+)')
+LOC_CONTROL_B_RE = re.compile(rb'\n\t\t\tcontrol=([\d.]+)')
+COUNTRY_NAME_B_RE = re.compile(rb'country_name="([^"]+)"')
+FLAG_B_RE = re.compile(rb'\n\t\t\tflag=(\w+)')
+
+# tag -> block byte span per save file, built on first lookup
+_country_index_cache: dict[str, dict[str, tuple[int, int]]] = {}
+
+
+def build_country_index(mm, span: tuple[int, int]) -> dict[str, tuple[int, int]]:
+    """Map every tag to its country block's byte span in one database sweep.
+
+    Both country_name="TAG" and flag=TAG map to the block, so formed nations
+    (whose flag keeps the original tag) resolve either way.
+    """
+    index = {}
+    setdefault = index.setdefault
+    name_search = COUNTRY_NAME_B_RE.search
+    flag_search = FLAG_B_RE.search
+    headers = list(COUNTRY_HEADER_B_RE.finditer(mm, span[0], span[1]))
+    for i, header in enumerate(headers):
+        start = header.start() + 1
+        end = headers[i + 1].start() + 1 if i + 1 < len(headers) else span[1]
+        name = name_search(mm, start, end)
+        if name:
+            setdefault(name.group(1).decode(), (start, end))
+        flag = flag_search(mm, start, end)
+        if flag:
+            setdefault(flag.group(1).decode(), (start, end))
+    return index
+
+
+def _country_index(filepath: str) -> dict[str, tuple[int, int]]:
+    index = _country_index_cache.get(filepath)
+    if index is None:
+        span = locate_database(open_save(filepath), b'countries')
+        index = build_country_index(open_save(filepath), span) if span else {}
+        _country_index_cache[filepath] = index
+    return index
 
 
 def find_country_in_file(filepath: str, tag: str) -> str | None:
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_database = False
-        collecting = False
-        depth = 0
-        lines = []
-        recent_lines = []  # Keep track of recent lines to find block start
-
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-            if not in_database:
-                if line.strip().startswith('database='):
-                    in_database = True
-                continue
-            if not collecting:
-                # Keep last 10 lines to find the block start (country_name={ name="X" } adds extra lines)
-                recent_lines.append(line)
-                if len(recent_lines) > 10:
-                    recent_lines.pop(0)
-
-                # Match: country_name="TAG" or flag=TAG
-                if f'country_name="{tag}"' in line or f'flag={tag}' in line:
-                    collecting = True
-                    # Get indent level of country_name line (country block start is one level less)
-                    name_indent = len(line) - len(line.lstrip('\t'))
-                    target_indent = name_indent - 1  # Country block starts one tab level up
-                    # Find the line with ID={ pattern at correct indent level
-                    for i in range(len(recent_lines) - 1, -1, -1):  # Search backward
-                        prev = recent_lines[i]
-                        prev_indent = len(prev) - len(prev.lstrip('\t'))
-                        stripped = prev.strip()
-                        if prev_indent == target_indent and '={' in stripped and stripped[0].isdigit():
-                            lines.extend(recent_lines[i:])
-                            depth = sum(l.count('{') - l.count('}') for l in lines)
-                            break
-                    else:
-                        # Fallback: use all recent lines
-                        lines.extend(recent_lines)
-                        depth = sum(l.count('{') - l.count('}') for l in lines)
-            else:
-                lines.append(line)
-                depth += line.count('{') - line.count('}')
-                if depth <= 0:
-                    break
+    block = _country_index(filepath).get(tag)
+    if block is None:
+        return None
+    mm = open_save(filepath)
+    return mm[block[0]:block[1]].decode('utf-8', errors='replace')
 
-        return ''.join(lines) if lines else None
+
+def find_countries_in_file(filepath: str, tags) -> dict[str, str]:
+    """Resolve many tags against one save in a single index pass.
+
+    Returns tag -> decoded country block for every tag that exists.
+    """
+    found = {}
+    for tag in tags:
+        text = find_country_in_file(filepath, tag)
+        if text:
+            found[tag] = text
+    return found
 
 
 def parse_country(text: str, tag: str) -> CountryStats:
-    stats = CountryStats(tag=tag, name=PLAYER_COUNTRIES.get(tag, tag))
+    # find_country_in_file returns the whole 'ID={...}' block; scan inside it
+    header = re.match(r'\s*\d+=\{', text)
+    if header:
+        text = text[header.end():]
+
+    # One pass over the whole block; nested blocks of interest get their own
+    # (much smaller) pass over their slice
+    fields = scan_fields(text)
 
     # Ruler
-    govt_block = extract_block(text, 'government')
-    stats.ruler_id = extract_value(govt_block, r'ruler=(\d+)', int, 0)
+    govt_block = field_block(text, fields, 'government')
+    govt = scan_fields(govt_block)
+    ruler_id = field_value(govt, 'ruler', int, 0)
     # Check for regency - if there's an active_regent, use that for display
-    active_regent_id = extract_value(govt_block, r'active_regent=(\d+)', int, 0)
-    if active_regent_id:
-        stats.is_regency = True
-        stats.regent_id = active_regent_id
+    regent_id = field_value(govt, 'active_regent', int, 0)
+    if regent_id and not ruler_id:
         # During regency, the heir might be in heir= field
-        if not stats.ruler_id:
-            stats.ruler_id = extract_value(govt_block, r'heir=(\d+)', int, 0)
-
-    # Rank - use great_power_rank field (not score_place which is different)
-    stats.great_power_rank = extract_value(text, r'great_power_rank=(\d+)', int, 0)
+        ruler_id = field_value(govt, 'heir', int, 0)
 
     # Currency
-    currency = extract_block(text, 'currency_data')
-    stats.gold = extract_value(currency, r'gold=([\d.-]+)', float, 0.0)
-    stats.stability = extract_value(currency, r'stability=([\d.-]+)', float, 0.0)
-    stats.prestige = extract_value(currency, r'prestige=([\d.-]+)', float, 0.0)
-    stats.army_tradition = extract_value(currency, r'army_tradition=([\d.]+)', float, 0.0)
-    stats.navy_tradition = extract_value(currency, r'navy_tradition=([\d.]+)', float, 0.0)
-    stats.manpower = extract_value(currency, r'manpower=([\d.]+)', float, 0.0)
-    stats.sailors = extract_value(currency, r'sailors=([\d.]+)', float, 0.0)
+    currency = scan_fields(field_block(text, fields, 'currency_data'))
 
     # Economy
-    stats.monthly_income = extract_value(text, r'estimated_monthly_income=([\d.]+)', float, 0.0)
-    stats.current_tax_base = extract_value(text, r'current_tax_base=([\d.]+)', float, 0.0)
-    economy = extract_block(text, 'economy')
-    stats.loan_capacity = extract_value(economy, r'loan_capacity=([\d.]+)', float, 0.0)
-
-    # Population
-    stats.population = extract_value(text, r'last_months_population=([\d.]+)', float, 0.0)
-    stats.max_manpower = extract_value(text, r'max_manpower=([\d.]+)', float, 0.0)
-    stats.monthly_manpower = extract_value(text, r'monthly_manpower=([\d.]+)', float, 0.0)
-    stats.max_sailors = extract_value(text, r'max_sailors=([\d.]+)', float, 0.0)
-
-    # Provinces
-    prov_match = re.search(r'provinces=\{([^}]+)\}', text)
-    stats.num_provinces = len(prov_match.group(1).split()) if prov_match else 0
-
-    # Military
-    units_match = re.search(r'\bunits=\{([^}]+)\}', text)
-    stats.num_units = len(units_match.group(1).split()) if units_match else 0
-    subunits_match = re.search(r'owned_subunits=\{([^}]+)\}', text)
-    stats.num_subunits = len(subunits_match.group(1).split()) if subunits_match else 0
-
-    # Production
-    stats.total_produced = extract_value(text, r'total_produced=([\d.]+)', float, 0.0)
-    stats.produced_goods = extract_dict(text, 'last_month_produced')
+    economy = scan_fields(field_block(text, fields, 'economy'))
 
     # Tech
-    advances = extract_dict(text, 'researched_advances')
-    stats.num_researched_advances = sum(1 for v in advances.values() if v == True)
-    stats.institutions = [k for k, v in extract_dict(text, 'institutions').items() if v == True]
+    advances = parse_kv_block(field_block(text, fields, 'researched_advances'))
+    institutions = [k for k, v in parse_kv_block(field_block(text, fields, 'institutions')).items() if v is True]
 
     # Research progress - extract from current_research block
-    research_block = extract_block(text, 'current_research')
-    if research_block:
-        stats.research_progress = extract_value(research_block, r'progress=([\d.]+)', float, 0.0)
+    research = scan_fields(field_block(text, fields, 'current_research'))
 
     # Government
-    stats.government_type = extract_value(govt_block, r'type=(\w+)', str, "")
-    stats.employment_system = extract_value(text, r'employment_system=(\w+)', str, "")
-    stats.religion_id = extract_value(text, r'primary_religion=(\d+)', int, 0)
-    stats.religion_name = RELIGION_NAMES.get(stats.religion_id, f"id_{stats.religion_id}")
+    religion_id = field_value(fields, 'primary_religion', int, 0)
 
-    # Privileges & Reforms
-    stats.privileges = extract_nested_objects(govt_block, 'implemented_privileges')
-    stats.num_privileges = len(stats.privileges)
-    stats.reforms = extract_nested_objects(govt_block, 'implemented_reforms')
-    stats.num_reforms = len(stats.reforms)
+    # Privileges & Reforms; privilege keys get hammered by dict lookups in
+    # the report generators, so intern them for pointer-fast hashing
+    privileges = [sys.intern(p) for p in
+                  OBJECT_RE.findall(field_block(govt_block, govt, 'implemented_privileges'))]
+    reforms = OBJECT_RE.findall(field_block(govt_block, govt, 'implemented_reforms'))
 
     # Laws
-    laws_block = extract_block(govt_block, 'implemented_laws')
-    for match in re.finditer(r'(\w+)=\{[^}]*object=(\w+)', laws_block):
-        stats.laws[match.group(1)] = match.group(2)
-
-    # Values
-    stats.values = extract_dict(text, 'societal_values')
+    laws_block = field_block(govt_block, govt, 'implemented_laws')
+    laws = {match.group(1): match.group(2) for match in LAW_CHOICE_RE.finditer(laws_block)}
 
     # Control - extract from variables section
     # Pattern: flag=average_control_in_home_region_target_variable followed by identity=XXXXX
-    control_match = re.search(
-        r'flag=average_control_in_home_region_target_variable[\s\n\t]*data=\{[\s\n\t]*type=value[\s\n\t]*identity=(\d+)',
-        text
+    control_match = CONTROL_VAR_RE.search(text)
+
+    # Build the dataclass in one shot: fields we pass here never trigger
+    # their default_factory, so no throwaway lists/dicts get allocated
+    return CountryStats(
+        tag=sys.intern(tag),
+        name=PLAYER_COUNTRIES.get(tag, tag),
+        ruler_id=ruler_id,
+        is_regency=bool(regent_id),
+        regent_id=regent_id,
+        # Rank - use great_power_rank field (not score_place which is different)
+        great_power_rank=field_value(fields, 'great_power_rank', int, 0),
+        gold=field_value(currency, 'gold', float, 0.0),
+        stability=field_value(currency, 'stability', float, 0.0),
+        prestige=field_value(currency, 'prestige', float, 0.0),
+        army_tradition=field_value(currency, 'army_tradition', float, 0.0),
+        navy_tradition=field_value(currency, 'navy_tradition', float, 0.0),
+        manpower=field_value(currency, 'manpower', float, 0.0),
+        sailors=field_value(currency, 'sailors', float, 0.0),
+        monthly_income=field_value(fields, 'estimated_monthly_income', float, 0.0),
+        current_tax_base=field_value(fields, 'current_tax_base', float, 0.0),
+        loan_capacity=field_value(economy, 'loan_capacity', float, 0.0),
+        population=field_value(fields, 'last_months_population', float, 0.0),
+        max_manpower=field_value(fields, 'max_manpower', float, 0.0),
+        monthly_manpower=field_value(fields, 'monthly_manpower', float, 0.0),
+        max_sailors=field_value(fields, 'max_sailors', float, 0.0),
+        num_provinces=len(field_block(text, fields, 'provinces').split()),
+        num_units=len(field_block(text, fields, 'units').split()),
+        num_subunits=len(field_block(text, fields, 'owned_subunits').split()),
+        total_produced=field_value(fields, 'total_produced', float, 0.0),
+        produced_goods=parse_kv_block(field_block(text, fields, 'last_month_produced')),
+        num_researched_advances=sum(1 for v in advances.values() if v is True),
+        institutions=institutions,
+        institutions_set=frozenset(institutions),
+        research_progress=field_value(research, 'progress', float, 0.0),
+        government_type=field_value(govt, 'type', str, ""),
+        employment_system=field_value(fields, 'employment_system', str, ""),
+        religion_id=religion_id,
+        religion_name=RELIGION_NAMES.get(religion_id, f"id_{religion_id}"),
+        privileges=privileges,
+        num_privileges=len(privileges),
+        reforms=reforms,
+        num_reforms=len(reforms),
+        laws=laws,
+        values=parse_kv_block(field_block(text, fields, 'societal_values')),
+        # Convert control from internal format
+        average_control=int(control_match.group(1)) / 1000 if control_match else 0.0,
+        historical_population=parse_list_block(field_block(text, fields, 'historical_population')),
+        historical_tax_base=parse_list_block(field_block(text, fields, 'historical_tax_base')),
     )
-    if control_match:
-        stats.average_control = int(control_match.group(1)) / 1000  # Convert from internal format
 
-    # Time series
-    stats.historical_population = extract_list_values(text, 'historical_population')
-    stats.historical_tax_base = extract_list_values(text, 'historical_tax_base')
 
-    return stats
+def parse_player(job: tuple[str, list, str]) -> CountryStats | None:
+    """Process-pool worker: resolve one player's current tag and parse it.
+
+    Tries the player's tags newest (formed nation) first, then fills in
+    ruler/regent character stats from the same save.
+    """
+    filepath, player_tags, save_date = job
+    for tag in reversed(player_tags):
+        country_text = find_country_in_file(filepath, tag)
+        if not country_text:
+            continue
+        stats = parse_country(country_text, tag)
+
+        chars = find_characters(filepath, [i for i in (stats.ruler_id, stats.regent_id) if i])
+
+        # Get ruler stats
+        if stats.ruler_id:
+            ruler = chars.get(stats.ruler_id)
+            if ruler:
+                stats.ruler_adm = int(ruler['adm'])
+                stats.ruler_dip = int(ruler['dip'])
+                stats.ruler_mil = int(ruler['mil'])
+                stats.ruler_name = ruler['first_name'].replace('name_', '').title()
+                stats.ruler_traits = ruler.get('traits', [])
+                stats.ruler_birth_date = ruler.get('birth_date', '')
+                if stats.ruler_birth_date:
+                    stats.ruler_age = calculate_age(stats.ruler_birth_date, save_date)
+
+        # Get regent stats if in regency
+        if stats.regent_id:
+            regent = chars.get(stats.regent_id)
+            if regent:
+                stats.regent_adm = int(regent['adm'])
+                stats.regent_dip = int(regent['dip'])
+                stats.regent_mil = int(regent['mil'])
+                stats.regent_name = regent['first_name'].replace('name_', '').title()
+                if regent.get('birth_date'):
+                    stats.regent_age = calculate_age(regent['birth_date'], save_date)
+
+        return stats
+    return None
 
 
 def get_save_date(filepath: str) -> str:
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        for i, line in enumerate(f):
-            if 'date=' in line and '.' in line:
-                match = re.search(r'date=(\d+\.\d+\.\d+)', line)
-                if match:
-                    return match.group(1)
-            if i > 100:
-                break
-    return "Unknown"
+    mm = open_save(filepath)
+    # The date sits in the save header; one bounded scan of the raw bytes
+    match = DATE_B_RE.search(mm, 0, 8192)
+    return match.group(1).decode() if match else "Unknown"
 
 
+@lru_cache(maxsize=None)
 def extract_country_tags(filepath: str) -> dict[int, str]:
     """Extract country ID -> tag mapping from countries.tags section."""
-    tags = {}
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_tags = False
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-            if not in_tags:
-                if line.strip().startswith('tags='):
-                    in_tags = True
-                continue
-            # Parse tag entries: ID=TAG
-            stripped = line.strip()
-            if stripped == '}':
-                break
-            match = re.match(r'(\d+)=(\w+)', stripped)
-            if match:
-                tags[int(match.group(1))] = match.group(2)
-    return tags
-
-
-def extract_location_control(filepath: str) -> dict[int, list[float]]:
-    """Extract control values per owner ID from locations section.
-
-    Returns dict mapping owner_id -> list of control values (0-1 scale).
-    Locations without explicit control field have 0 control.
+    mm = open_save(filepath)
+    sec = mm.find(b'countries={')
+    if sec == -1:
+        return {}
+    start = mm.find(b'tags={', sec)
+    if start == -1:
+        return {}
+    # tags={ sits at one tab, so it closes at the first "\n\t}"
+    end = mm.find(b'\n\t}', start)
+    if end == -1:
+        end = len(mm)
+    return {int(m.group(1)): m.group(2).decode()
+            for m in TAG_ENTRY_B_RE.finditer(mm, start, end)}
+
+
+@lru_cache(maxsize=None)
+def extract_location_control(filepath: str) -> dict[int, tuple[float, int]]:
+    """Accumulate control per owner ID from the locations section.
+
+    Returns dict mapping owner_id -> (control_sum, location_count) on the
+    0-1 scale; only the mean is ever consumed, so running sums beat
+    materializing a float list per owner. Locations without an explicit
+    control field count as 0.
     """
     owner_controls = {}
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_locations = False
-        in_inner_locations = False
-        in_location_block = False
-        current_owner = None
-        current_control = None
-        block_depth = 0
-
-        for line in f:
-            stripped = line.strip()
-
-            # Find outer locations={ (at start of line, no indent)
-            if not in_locations:
-                if line.startswith('locations={'):
-                    in_locations = True
-                continue
-
-            # Find inner locations={ (indented)
-            if not in_inner_locations:
-                if stripped == 'locations={':
-                    in_inner_locations = True
-                continue
-
-            # Track block depth and detect location blocks (e.g., "123={")
-            if re.match(r'\d+={', stripped):
-                in_location_block = True
-                block_depth = 1
-                current_owner = None
-                current_control = None
-                continue
-
-            if in_location_block:
-                block_depth += stripped.count('{') - stripped.count('}')
-
-                # Track current location's owner
-                if stripped.startswith('owner='):
-                    try:
-                        current_owner = int(stripped.split('=')[1])
-                    except ValueError:
-                        current_owner = None
-
-                # Track control value
-                if stripped.startswith('control='):
-                    try:
-                        current_control = float(stripped.split('=')[1])
-                    except ValueError:
-                        current_control = 0.0
-
-                # End of location block
-                if block_depth <= 0:
-                    if current_owner is not None:
-                        control_val = current_control if current_control is not None else 0.0
-                        if current_owner not in owner_controls:
-                            owner_controls[current_owner] = []
-                        owner_controls[current_owner].append(control_val)
-                    in_location_block = False
-                    current_owner = None
-                    current_control = None
-
-            # Stop at end of outer locations section (unindented closing brace)
-            if line.startswith('}') and in_inner_locations:
-                break
-
+    mm = open_save(filepath)
+    outer = mm.find(b'\nlocations={')
+    if outer == -1:
+        return owner_controls
+    inner = mm.find(b'\tlocations={', outer)
+    if inner == -1:
+        return owner_controls
+    end = skip_block_bytes(mm, inner + len(b'\tlocations={'))
+
+    # Location blocks sit at two tabs with owner/control one level deeper;
+    # each block is the slice between consecutive headers, so owner and
+    # control resolve with one bounded search each and nothing is decoded
+    headers = list(LOC_HEADER_B_RE.finditer(mm, inner, end))
+    for i, header in enumerate(headers):
+        block_end = headers[i + 1].start() if i + 1 < len(headers) else end
+        owner = LOC_OWNER_B_RE.search(mm, header.end(), block_end)
+        if owner is None:
+            continue
+        control = LOC_CONTROL_B_RE.search(mm, header.end(), block_end)
+        owner_id = int(owner.group(1))
+        total, count = owner_controls.get(owner_id, (0.0, 0))
+        owner_controls[owner_id] = (total + (float(control.group(1)) if control else 0.0),
+                                    count + 1)
     return owner_controls
 
 
@@ -623,8 +769,8 @@ def calculate_average_control(filepath: str, player_tags: list[str]) -> dict[str
     for tag in player_tags:
         owner_id = tag_to_id.get(tag)
         if owner_id is not None and owner_id in owner_controls:
-            controls = owner_controls[owner_id]
-            avg = sum(controls) / len(controls) if controls else 0.0
+            total, count = owner_controls[owner_id]
+            avg = total / count if count else 0.0
             result[tag] = avg * 100  # Convert to 0-100 scale
         else:
             result[tag] = 0.0
@@ -632,62 +778,26 @@ def calculate_average_control(filepath: str, player_tags: list[str]) -> dict[str
     return result
 
 
+@lru_cache(maxsize=None)
 def extract_dependencies(filepath: str) -> dict[int, list[tuple[int, str]]]:
     """Extract all subject/dependency relationships from diplomacy_manager.
 
     Returns dict mapping overlord_id -> [(subject_id, subject_type), ...]
     """
     dependencies = {}
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_diplomacy = False
-        in_dependency = False
-        current_first = None
-        current_second = None
-        current_type = None
-
-        for line in f:
-            stripped = line.strip()
-
-            # Find diplomacy_manager section
-            if not in_diplomacy:
-                if line.startswith('diplomacy_manager={'):
-                    in_diplomacy = True
-                continue
-
-            # Look for dependency blocks
-            if stripped == 'dependency={':
-                in_dependency = True
-                current_first = None
-                current_second = None
-                current_type = None
-                continue
-
-            if in_dependency:
-                if stripped.startswith('first='):
-                    try:
-                        current_first = int(stripped.split('=')[1])
-                    except ValueError:
-                        pass
-                elif stripped.startswith('second='):
-                    try:
-                        current_second = int(stripped.split('=')[1])
-                    except ValueError:
-                        pass
-                elif stripped.startswith('subject_type='):
-                    current_type = stripped.split('=')[1]
-
-                # End of dependency block
-                if stripped == '}':
-                    if current_first is not None and current_second is not None and current_type:
-                        if current_first not in dependencies:
-                            dependencies[current_first] = []
-                        dependencies[current_first].append((current_second, current_type))
-                    in_dependency = False
-
-            # Stop at end of diplomacy_manager section
-            if line.startswith('}') and in_diplomacy and not in_dependency:
-                break
-
+    mm = open_save(filepath)
+    sec = mm.find(b'\ndiplomacy_manager={')
+    if sec == -1:
+        return dependencies
+    end = skip_block_bytes(mm, sec + len(b'\ndiplomacy_manager={'))
+    for match in DEP_BLOCK_B_RE.finditer(mm, sec, end):
+        block = match.group(1)
+        first = DEP_FIRST_B_RE.search(block)
+        second = DEP_SECOND_B_RE.search(block)
+        subject_type = DEP_TYPE_B_RE.search(block)
+        if first and second and subject_type:
+            dependencies.setdefault(int(first.group(1)), []).append(
+                (int(second.group(1)), subject_type.group(1).decode()))
     return dependencies
 
 
@@ -717,11 +827,29 @@ def get_subjects_for_countries(filepath: str, player_tags: list[str]) -> dict[st
     return result
 
 
+@lru_cache(maxsize=4096)
 def fmt_pop(val: float) -> str:
     """Population in millions."""
     return f"{val/1000:.2f}M" if val >= 100 else f"{val:.1f}K"
 
 
+@lru_cache(maxsize=2048)
+def fmt_delta(val: float, precision: int = 0) -> str:
+    """Format a delta value with + or - prefix."""
+    if precision == 0:
+        return f"+{val:.0f}" if val >= 0 else f"{val:.0f}"
+    return f"+{val:.{precision}f}" if val >= 0 else f"{val:.{precision}f}"
+
+
+@lru_cache(maxsize=2048)
+def fmt_pop_delta(val: float) -> str:
+    """Format population delta (in thousands -> display as K or M)."""
+    if abs(val) >= 1000:
+        return f"+{val/1000:.2f}M" if val >= 0 else f"{val/1000:.2f}M"
+    return f"+{val:.1f}K" if val >= 0 else f"{val:.1f}K"
+
+
+@lru_cache(maxsize=4096)
 def fmt_num(val: float) -> str:
     if val >= 10000:
         return f"{val/1000:.1f}K"
@@ -730,36 +858,56 @@ def fmt_num(val: float) -> str:
     return f"{val:.1f}"
 
 
+# Section separators, prebuilt once; 55 keeps lines Discord-friendly
+EQ55 = "=" * 55
+DASH55 = "-" * 55
+EQ60 = "=" * 60
+
+# Societal value keys for the two compact VALUES tables in the summary
+VALUE_KEYS_1 = ('centralization_vs_decentralization', 'serfdom_vs_free_subjects',
+                'aristocracy_vs_plutocracy', 'traditionalist_vs_innovative',
+                'spiritualist_vs_humanist')
+VALUE_KEYS_2 = ('capital_economy_vs_traditional_economy', 'individualism_vs_communalism',
+                'quality_vs_quantity', 'offensive_vs_defensive', 'land_vs_naval',
+                'belligerent_vs_conciliatory')
+
+
+def gp_sort_key(c: CountryStats) -> int:
+    """Sort key for great-power order; unranked countries go last."""
+    return c.great_power_rank if c.great_power_rank > 0 else 9999
+
+
 def generate_summary_report(countries: list[CountryStats], save_date: str) -> str:
     """Generate the summary report (Discord-friendly, narrow format)."""
-    lines = []
-    W = 55  # Max line width for Discord
+    buf = io.StringIO()
+    w = buf.write
 
-    lines.append("=" * W)
-    lines.append("EU5 MP SESSION REPORT")
-    lines.append("=" * W)
-    lines.append(f"Save: {save_date} | Players: {len(countries)}")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    lines.append("")
+    w(EQ55 + "\n")
+    w("EU5 MP SESSION REPORT" + "\n")
+    w(EQ55 + "\n")
+    w(f"Save: {save_date} | Players: {len(countries)}" + "\n")
+    w(f"Generated: {time.strftime('%Y-%m-%d %H:%M')}" + "\n")
+    w("\n")
 
-    by_gp = sorted(countries, key=lambda c: c.great_power_rank if c.great_power_rank > 0 else 9999)
+    by_gp = sorted(countries, key=gp_sort_key)
 
     # === GREAT POWER RANKINGS ===
-    lines.append("=" * W)
-    lines.append("GREAT POWER RANKINGS")
-    lines.append("-" * W)
-    lines.append(f"{'#':<3}{'Tag':<5}{'GP':<4}{'Pop':<8}{'Income':<8}{'TaxBase':<8}")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("GREAT POWER RANKINGS" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'#':<3}{'Tag':<5}{'GP':<4}{'Pop':<8}{'Income':<8}{'TaxBase':<8}" + "\n")
+    w(DASH55 + "\n")
+    row = "{:<3}{:<5}{:<4}{:<8}{:<8}{:<8}\n".format
     for i, c in enumerate(by_gp, 1):
-        lines.append(f"{i:<3}{c.tag:<5}{c.great_power_rank:<4}{fmt_pop(c.population):<8}{fmt_num(c.monthly_income):<8}{fmt_num(c.current_tax_base):<8}")
-    lines.append("")
+        w(row(i, c.tag, c.great_power_rank, fmt_pop(c.population), fmt_num(c.monthly_income), fmt_num(c.current_tax_base)))
+    w("\n")
 
     # === RULER STATS ===
-    lines.append("=" * W)
-    lines.append("RULERS (sorted by total stats)")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'A':<4}{'D':<4}{'M':<4}{'Tot':<5}{'Age':<5}{'Name':<15}")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("RULERS (sorted by total stats)" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'A':<4}{'D':<4}{'M':<4}{'Tot':<5}{'Age':<5}{'Name':<15}" + "\n")
+    w(DASH55 + "\n")
 
     # For sorting, use regent stats if no ruler
     def get_effective_stats(c):
@@ -768,6 +916,7 @@ def generate_summary_report(countries: list[CountryStats], save_date: str) -> st
         return c.regent_adm + c.regent_dip + c.regent_mil
 
     by_ruler = sorted(countries, key=get_effective_stats, reverse=True)
+    row = "{:<5}{:<4}{:<4}{:<4}{:<5}{:<5}{:<15}\n".format
     for c in by_ruler:
         # Use regent stats if no ruler (pure regency with no heir data)
         if c.ruler_adm or c.ruler_dip or c.ruler_mil or c.ruler_name:
@@ -782,148 +931,149 @@ def generate_summary_report(countries: list[CountryStats], save_date: str) -> st
             age_str = str(c.regent_age) if c.regent_age > 0 else "?"
             name_str = (c.regent_name[:11] + " [Reg]") if c.regent_name else "?"
         total = adm + dip + mil
-        lines.append(f"{c.tag:<5}{adm:<4}{dip:<4}{mil:<4}{total:<5}{age_str:<5}{name_str:<15}")
+        w(row(c.tag, adm, dip, mil, total, age_str, name_str))
 
     # Show traits on separate lines
-    lines.append("")
-    lines.append("Ruler Traits:")
+    w("\n")
+    w("Ruler Traits:" + "\n")
     for c in by_ruler:
         if c.ruler_traits:
             traits_str = ", ".join(c.ruler_traits[:4])
             if len(c.ruler_traits) > 4:
                 traits_str += f" (+{len(c.ruler_traits)-4})"
-            lines.append(f"  {c.tag}: {traits_str}")
+            w(f"  {c.tag}: {traits_str}" + "\n")
 
     # Show regencies separately if any
     regencies = [c for c in countries if c.is_regency]
     if regencies:
-        lines.append("")
-        lines.append("Regencies:")
+        w("\n")
+        w("Regencies:" + "\n")
         for c in regencies:
             regent_age_str = str(c.regent_age) if c.regent_age > 0 else "?"
-            lines.append(f"  {c.tag}: Regent {c.regent_name} ({c.regent_adm}/{c.regent_dip}/{c.regent_mil}, age {regent_age_str})")
+            w(f"  {c.tag}: Regent {c.regent_name} ({c.regent_adm}/{c.regent_dip}/{c.regent_mil}, age {regent_age_str})" + "\n")
             if c.ruler_name:
                 heir_age_str = str(c.ruler_age) if c.ruler_age > 0 else "?"
-                lines.append(f"       Heir {c.ruler_name} ({c.ruler_adm}/{c.ruler_dip}/{c.ruler_mil}, age {heir_age_str})")
-    lines.append("")
+                w(f"       Heir {c.ruler_name} ({c.ruler_adm}/{c.ruler_dip}/{c.ruler_mil}, age {heir_age_str})" + "\n")
+    w("\n")
 
     # === ECONOMY ===
-    lines.append("=" * W)
-    lines.append("ECONOMY (by income)")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Income':<9}{'Treasury':<10}{'TaxBase':<9}{'LoanCap':<9}")
-    lines.append("-" * W)
-
-    by_income = sorted(countries, key=lambda c: c.monthly_income, reverse=True)
+    w(EQ55 + "\n")
+    w("ECONOMY (by income)" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Income':<9}{'Treasury':<10}{'TaxBase':<9}{'LoanCap':<9}" + "\n")
+    w(DASH55 + "\n")
+
+    by_income = sorted(countries, key=attrgetter('monthly_income'), reverse=True)
+    row = "{:<5}{:<9}{:<10}{:<9}{:<9}\n".format
     for c in by_income:
-        lines.append(f"{c.tag:<5}{fmt_num(c.monthly_income):<9}{fmt_num(c.gold):<10}{fmt_num(c.current_tax_base):<9}{fmt_num(c.loan_capacity):<9}")
-    lines.append("")
+        w(row(c.tag, fmt_num(c.monthly_income), fmt_num(c.gold), fmt_num(c.current_tax_base), fmt_num(c.loan_capacity)))
+    w("\n")
 
     # === POPULATION ===
-    lines.append("=" * W)
-    lines.append("POPULATION")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Pop':<10}{'Provs':<7}{'Pop/Prov':<10}")
-    lines.append("-" * W)
-
-    by_pop = sorted(countries, key=lambda c: c.population, reverse=True)
+    w(EQ55 + "\n")
+    w("POPULATION" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Pop':<10}{'Provs':<7}{'Pop/Prov':<10}" + "\n")
+    w(DASH55 + "\n")
+
+    by_pop = sorted(countries, key=attrgetter('population'), reverse=True)
+    row = "{:<5}{:<10}{:<7}{:<10}\n".format
     for c in by_pop:
         pop_per_prov = c.population / c.num_provinces if c.num_provinces > 0 else 0
-        lines.append(f"{c.tag:<5}{fmt_pop(c.population):<10}{c.num_provinces:<7}{fmt_pop(pop_per_prov):<10}")
-    lines.append("")
+        w(row(c.tag, fmt_pop(c.population), c.num_provinces, fmt_pop(pop_per_prov)))
+    w("\n")
 
     # === MILITARY ===
-    lines.append("=" * W)
-    lines.append("MILITARY (by regiments)")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Regs':<6}{'MP':<7}{'MaxMP':<7}{'ArmyT':<7}{'NavyT':<7}")
-    lines.append("-" * W)
-
-    by_mil = sorted(countries, key=lambda c: c.num_subunits, reverse=True)
+    w(EQ55 + "\n")
+    w("MILITARY (by regiments)" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Regs':<6}{'MP':<7}{'MaxMP':<7}{'ArmyT':<7}{'NavyT':<7}" + "\n")
+    w(DASH55 + "\n")
+
+    by_mil = sorted(countries, key=attrgetter('num_subunits'), reverse=True)
+    row = "{:<5}{:<6}{:<7.1f}{:<7.1f}{:<7.1f}{:<7.1f}\n".format
     for c in by_mil:
-        lines.append(f"{c.tag:<5}{c.num_subunits:<6}{c.manpower:<7.1f}{c.max_manpower:<7.1f}{c.army_tradition:<7.1f}{c.navy_tradition:<7.1f}")
-    lines.append("")
+        w(row(c.tag, c.num_subunits, c.manpower, c.max_manpower, c.army_tradition, c.navy_tradition))
+    w("\n")
 
     # === PRODUCTION ===
-    lines.append("=" * W)
-    lines.append("PRODUCTION")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Total':<8}{'Top 3 Goods':<40}")
-    lines.append("-" * W)
-
-    by_prod = sorted(countries, key=lambda c: c.total_produced, reverse=True)
+    w(EQ55 + "\n")
+    w("PRODUCTION" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Total':<8}{'Top 3 Goods':<40}" + "\n")
+    w(DASH55 + "\n")
+
+    by_prod = sorted(countries, key=attrgetter('total_produced'), reverse=True)
+    row = "{:<5}{:<8}{}\n".format
     for c in by_prod:
-        top_goods = sorted(c.produced_goods.items(), key=lambda x: x[1], reverse=True)[:3]
+        top_goods = heapq.nlargest(3, c.produced_goods.items(), key=itemgetter(1))
         goods_str = ", ".join(f"{g[0]}:{g[1]:.0f}" for g in top_goods)
-        lines.append(f"{c.tag:<5}{fmt_num(c.total_produced):<8}{goods_str[:40]}")
-    lines.append("")
+        w(row(c.tag, fmt_num(c.total_produced), goods_str[:40]))
+    w("\n")
 
     # === TECHNOLOGY ===
-    lines.append("=" * W)
-    lines.append("TECHNOLOGY")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("TECHNOLOGY" + "\n")
+    w(DASH55 + "\n")
 
-    # Find baseline institutions (what most countries have)
-    all_institutions = set()
-    for c in countries:
-        all_institutions.update(c.institutions)
-
-    # Count how many countries have each institution
-    inst_counts = {inst: sum(1 for c in countries if inst in c.institutions) for inst in all_institutions}
+    # Count how many countries have each institution in one flattened pass
+    inst_counts = Counter(inst for c in countries for inst in c.institutions)
     # Baseline = institutions that majority have
     baseline = {inst for inst, count in inst_counts.items() if count > len(countries) // 2}
 
-    lines.append(f"{'Tag':<5}{'Advs':<6}{'Inst':<5}{'Missing/Extra':<35}")
-    lines.append("-" * W)
+    w(f"{'Tag':<5}{'Advs':<6}{'Inst':<5}{'Missing/Extra':<35}" + "\n")
+    w(DASH55 + "\n")
 
-    by_tech = sorted(countries, key=lambda c: c.num_researched_advances, reverse=True)
+    by_tech = sorted(countries, key=attrgetter('num_researched_advances'), reverse=True)
+    row = "{:<5}{:<6}{:<5}{}\n".format
     for c in by_tech:
-        c_inst = set(c.institutions)
-        missing = baseline - c_inst
-        extra = c_inst - baseline
+        missing = baseline - c.institutions_set
+        extra = c.institutions_set - baseline
 
         if missing:
-            inst_str = ", ".join(f"-{i}" for i in sorted(missing))
+            inst_str = ", ".join(["-" + i for i in sorted(missing)])
         elif extra:
-            inst_str = ", ".join(f"+{i}" for i in sorted(extra))
+            inst_str = ", ".join(["+" + i for i in sorted(extra)])
         else:
             inst_str = "(complete)"
 
-        lines.append(f"{c.tag:<5}{c.num_researched_advances:<6}{len(c.institutions):<5}{inst_str[:35]}")
-    lines.append("")
+        w(row(c.tag, c.num_researched_advances, len(c.institutions), inst_str[:35]))
+    w("\n")
 
     # === GOVERNMENT ===
-    lines.append("=" * W)
-    lines.append("GOVERNMENT & RELIGION")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Type':<10}{'Religion':<10}{'Stab':<7}{'Prest':<7}")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("GOVERNMENT & RELIGION" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Type':<10}{'Religion':<10}{'Stab':<7}{'Prest':<7}" + "\n")
+    w(DASH55 + "\n")
 
+    row = "{:<5}{:<10}{:<10}{:<7.1f}{:<7.1f}\n".format
     for c in by_gp:
-        lines.append(f"{c.tag:<5}{c.government_type[:9]:<10}{c.religion_name[:9]:<10}{c.stability:<7.1f}{c.prestige:<7.1f}")
-    lines.append("")
+        w(row(c.tag, c.government_type[:9], c.religion_name[:9], c.stability, c.prestige))
+    w("\n")
 
     # === CONTROL ===
-    lines.append("=" * W)
-    lines.append("CONTROL (avg across all locations)")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Control':<10}{'Provs':<7}")
-    lines.append("-" * W)
-
-    by_control = sorted(countries, key=lambda c: c.average_control, reverse=True)
+    w(EQ55 + "\n")
+    w("CONTROL (avg across all locations)" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Control':<10}{'Provs':<7}" + "\n")
+    w(DASH55 + "\n")
+
+    by_control = sorted(countries, key=attrgetter('average_control'), reverse=True)
+    row = "{:<5}{:<10.1f}{:<7}\n".format
     for c in by_control:
-        lines.append(f"{c.tag:<5}{c.average_control:<10.1f}{c.num_provinces:<7}")
-    lines.append("")
+        w(row(c.tag, c.average_control, c.num_provinces))
+    w("\n")
 
     # === SUBJECTS ===
     # Only show if any country has subjects
-    has_subjects = any(len(c.subjects) > 0 for c in countries)
+    has_subjects = any(c.subjects for c in countries)
     if has_subjects:
-        lines.append("=" * W)
-        lines.append("SUBJECTS (with combined totals)")
-        lines.append("-" * W)
-        lines.append(f"{'Tag':<5}{'#':<3}{'Subjects':<20}{'TotPop':<9}{'TotTax':<9}")
-        lines.append("-" * W)
+        w(EQ55 + "\n")
+        w("SUBJECTS (with combined totals)" + "\n")
+        w(DASH55 + "\n")
+        w(f"{'Tag':<5}{'#':<3}{'Subjects':<20}{'TotPop':<9}{'TotTax':<9}" + "\n")
+        w(DASH55 + "\n")
 
         by_subjects = sorted(countries, key=lambda c: len(c.subjects), reverse=True)
         for c in by_subjects:
@@ -931,126 +1081,106 @@ def generate_summary_report(countries: list[CountryStats], save_date: str) -> st
                 subj_str = ",".join(c.subjects[:4])
                 if len(c.subjects) > 4:
                     subj_str += "..."
-                lines.append(f"{c.tag:<5}{len(c.subjects):<3}{subj_str:<20}{fmt_pop(c.total_population):<9}{fmt_num(c.total_tax_base):<9}")
+                w(f"{c.tag:<5}{len(c.subjects):<3}{subj_str:<20}{fmt_pop(c.total_population):<9}{fmt_num(c.total_tax_base):<9}" + "\n")
             else:
-                lines.append(f"{c.tag:<5}{0:<3}{'-':<20}{fmt_pop(c.population):<9}{fmt_num(c.current_tax_base):<9}")
-        lines.append("")
+                w(f"{c.tag:<5}{0:<3}{'-':<20}{fmt_pop(c.population):<9}{fmt_num(c.current_tax_base):<9}" + "\n")
+        w("\n")
 
     # === SOCIETAL VALUES - Compact ===
-    lines.append("=" * W)
-    lines.append("VALUES (cent/serf/arist/trad/spirit)")
-    lines.append("-" * W)
-    value_keys_1 = ['centralization_vs_decentralization', 'serfdom_vs_free_subjects',
-                    'aristocracy_vs_plutocracy', 'traditionalist_vs_innovative', 'spiritualist_vs_humanist']
+    w(EQ55 + "\n")
+    w("VALUES (cent/serf/arist/trad/spirit)" + "\n")
+    w(DASH55 + "\n")
     for c in by_gp:
-        vals = [c.values.get(k, -999) for k in value_keys_1]
+        vals = [c.values.get(k, -999) for k in VALUE_KEYS_1]
         val_strs = [f"{v:>4.0f}" if v != -999 else "   -" for v in vals]
-        lines.append(f"{c.tag:<5} {' '.join(val_strs)}")
-    lines.append("")
+        w(f"{c.tag:<5} {' '.join(val_strs)}" + "\n")
+    w("\n")
 
-    lines.append("VALUES (capital/indiv/qual/offen/land/bell)")
-    lines.append("-" * W)
-    value_keys_2 = ['capital_economy_vs_traditional_economy', 'individualism_vs_communalism',
-                    'quality_vs_quantity', 'offensive_vs_defensive', 'land_vs_naval', 'belligerent_vs_conciliatory']
+    w("VALUES (capital/indiv/qual/offen/land/bell)" + "\n")
+    w(DASH55 + "\n")
     for c in by_gp:
-        vals = [c.values.get(k, -999) for k in value_keys_2]
+        vals = [c.values.get(k, -999) for k in VALUE_KEYS_2]
         val_strs = [f"{v:>4.0f}" if v != -999 else "   -" for v in vals]
-        lines.append(f"{c.tag:<5} {' '.join(val_strs)}")
-    lines.append("")
+        w(f"{c.tag:<5} {' '.join(val_strs)}" + "\n")
+    w("\n")
 
-    lines.append("=" * W)
-    lines.append("END OF SUMMARY")
-    lines.append("=" * W)
+    w(EQ55 + "\n")
+    w("END OF SUMMARY" + "\n")
+    w(EQ55 + "\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_detailed_profiles(countries: list[CountryStats], save_date: str) -> str:
     """Generate detailed country profiles (separate file)."""
-    lines = []
+    buf = io.StringIO()
+    w = buf.write
 
-    lines.append("=" * 60)
-    lines.append("DETAILED COUNTRY PROFILES")
-    lines.append(f"Save: {save_date}")
-    lines.append("=" * 60)
+    w(EQ60 + "\n")
+    w("DETAILED COUNTRY PROFILES" + "\n")
+    w(f"Save: {save_date}" + "\n")
+    w(EQ60 + "\n")
 
-    by_gp = sorted(countries, key=lambda c: c.great_power_rank if c.great_power_rank > 0 else 9999)
+    by_gp = sorted(countries, key=gp_sort_key)
 
     for c in by_gp:
-        lines.append("")
-        lines.append(f"{'='*60}")
-        lines.append(f"{c.tag} ({c.name}) - GP #{c.great_power_rank}")
-        lines.append(f"{'='*60}")
+        w("\n")
+        w(EQ60 + "\n")
+        w(f"{c.tag} ({c.name}) - GP #{c.great_power_rank}" + "\n")
+        w(EQ60 + "\n")
 
         # Ruler
         age_str = f", age {c.ruler_age}" if c.ruler_age > 0 else ""
         if c.is_regency:
-            lines.append(f"REGENCY - Heir: {c.ruler_name} ({c.ruler_adm}/{c.ruler_dip}/{c.ruler_mil}{age_str})")
+            w(f"REGENCY - Heir: {c.ruler_name} ({c.ruler_adm}/{c.ruler_dip}/{c.ruler_mil}{age_str})" + "\n")
             regent_age_str = f", age {c.regent_age}" if c.regent_age > 0 else ""
-            lines.append(f"          Regent: {c.regent_name} ({c.regent_adm}/{c.regent_dip}/{c.regent_mil}{regent_age_str})")
+            w(f"          Regent: {c.regent_name} ({c.regent_adm}/{c.regent_dip}/{c.regent_mil}{regent_age_str})" + "\n")
         else:
-            lines.append(f"Ruler: {c.ruler_name} ({c.ruler_adm}/{c.ruler_dip}/{c.ruler_mil}{age_str})")
+            w(f"Ruler: {c.ruler_name} ({c.ruler_adm}/{c.ruler_dip}/{c.ruler_mil}{age_str})" + "\n")
         if c.ruler_traits:
-            lines.append(f"Traits: {', '.join(c.ruler_traits)}")
+            w(f"Traits: {', '.join(c.ruler_traits)}" + "\n")
 
-        lines.append("")
-        lines.append(f"Government: {c.government_type} | Religion: {c.religion_name}")
-        lines.append(f"Stability: {c.stability:.1f} | Prestige: {c.prestige:.1f}")
+        w("\n")
+        w(f"Government: {c.government_type} | Religion: {c.religion_name}" + "\n")
+        w(f"Stability: {c.stability:.1f} | Prestige: {c.prestige:.1f}" + "\n")
         if c.average_control > 0:
-            lines.append(f"Average Control: {c.average_control:.1f}%")
+            w(f"Average Control: {c.average_control:.1f}%" + "\n")
 
-        lines.append("")
-        lines.append(f"Population: {fmt_pop(c.population)} across {c.num_provinces} provinces")
-        lines.append(f"Income: {fmt_num(c.monthly_income)} | Treasury: {fmt_num(c.gold)}")
-        lines.append(f"Tax Base: {fmt_num(c.current_tax_base)} | Loan Cap: {fmt_num(c.loan_capacity)}")
+        w("\n")
+        w(f"Population: {fmt_pop(c.population)} across {c.num_provinces} provinces" + "\n")
+        w(f"Income: {fmt_num(c.monthly_income)} | Treasury: {fmt_num(c.gold)}" + "\n")
+        w(f"Tax Base: {fmt_num(c.current_tax_base)} | Loan Cap: {fmt_num(c.loan_capacity)}" + "\n")
 
-        lines.append("")
-        lines.append(f"Manpower: {c.manpower:.1f}/{c.max_manpower:.1f}")
-        lines.append(f"Regiments: {c.num_subunits}")
-        lines.append(f"Army Tradition: {c.army_tradition:.1f} | Navy: {c.navy_tradition:.1f}")
+        w("\n")
+        w(f"Manpower: {c.manpower:.1f}/{c.max_manpower:.1f}" + "\n")
+        w(f"Regiments: {c.num_subunits}" + "\n")
+        w(f"Army Tradition: {c.army_tradition:.1f} | Navy: {c.navy_tradition:.1f}" + "\n")
 
-        lines.append("")
-        lines.append(f"Tech: {c.num_researched_advances} advances")
-        lines.append(f"Institutions ({len(c.institutions)}): {', '.join(reversed(c.institutions))}")
+        w("\n")
+        w(f"Tech: {c.num_researched_advances} advances" + "\n")
+        w(f"Institutions ({len(c.institutions)}): {', '.join(reversed(c.institutions))}" + "\n")
 
         if c.reforms:
-            lines.append("")
-            lines.append(f"Reforms: {', '.join(c.reforms)}")
+            w("\n")
+            w(f"Reforms: {', '.join(c.reforms)}" + "\n")
 
         if c.privileges:
-            lines.append("")
-            lines.append(f"Privileges ({c.num_privileges} total):")
+            w("\n")
+            w(f"Privileges ({c.num_privileges} total):" + "\n")
             # Organize by estate
-            estates = {
-                'Nobles': [], 'Clergy': [], 'Burghers': [],
-                'Peasants': [], 'Dhimmi': [], 'Tribes': [],
-                'Cossacks': [], 'General': []
-            }
+            estates = defaultdict(list)
             for p in c.privileges:
-                if p.startswith(('nobles_', 'noble_', 'auxilium', 'primacy_of_nobility')):
-                    estates['Nobles'].append(p)
-                elif p.startswith(('clergy_', 'clerical_')):
-                    estates['Clergy'].append(p)
-                elif p.startswith(('burghers_', 'burgher_', 'formal_guilds', 'free_city', 'polish_merchant')):
-                    estates['Burghers'].append(p)
-                elif p.startswith(('peasants_', 'peasant_')):
-                    estates['Peasants'].append(p)
-                elif p.startswith(('dhimmi_', 'jizya')):
-                    estates['Dhimmi'].append(p)
-                elif p.startswith(('tribes_', 'tribal_')):
-                    estates['Tribes'].append(p)
-                elif p.startswith(('cossacks_', 'cossack_')):
-                    estates['Cossacks'].append(p)
-                else:
-                    estates['General'].append(p)
-
-            for estate, privs in estates.items():
+                estates[classify_privilege(p)].append(p)
+
+            for estate in ('Nobles', 'Clergy', 'Burghers', 'Peasants',
+                           'Dhimmi', 'Tribes', 'Cossacks', 'General'):
+                privs = estates.get(estate)
                 if privs:
-                    lines.append(f"  {estate}: {', '.join(privs)}")
+                    w(f"  {estate}: {', '.join(privs)}" + "\n")
 
         # Societal values
-        lines.append("")
-        lines.append("Societal Values:")
+        w("\n")
+        w("Societal Values:" + "\n")
         value_names = {
             'centralization_vs_decentralization': 'Centralization',
             'serfdom_vs_free_subjects': 'Serfdom',
@@ -1067,20 +1197,20 @@ def generate_detailed_profiles(countries: list[CountryStats], save_date: str) ->
         for key, name in value_names.items():
             val = c.values.get(key, None)
             if val is not None:
-                lines.append(f"  {name}: {val:.0f}")
+                w(f"  {name}: {val:.0f}" + "\n")
 
-    lines.append("")
-    lines.append("=" * 60)
-    lines.append("END OF DETAILED PROFILES")
-    lines.append("=" * 60)
+    w("\n")
+    w(EQ60 + "\n")
+    w("END OF DETAILED PROFILES" + "\n")
+    w(EQ60 + "\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_laws_report(countries: list[CountryStats], save_date: str) -> str:
     """Generate a laws comparison report grouped by law category."""
-    lines = []
-    W = 55
+    buf = io.StringIO()
+    w = buf.write
 
     # Define law categories with display names
     LAW_CATEGORIES = {
@@ -1106,170 +1236,217 @@ def generate_laws_report(countries: list[CountryStats], save_date: str) -> str:
     for c in countries:
         all_categories.update(c.laws.keys())
 
-    lines.append("=" * W)
-    lines.append("EU5 LAWS COMPARISON")
-    lines.append("=" * W)
-    lines.append(f"Save: {save_date} | Players: {len(countries)}")
-    lines.append("")
+    w(EQ55 + "\n")
+    w("EU5 LAWS COMPARISON" + "\n")
+    w(EQ55 + "\n")
+    w(f"Save: {save_date} | Players: {len(countries)}" + "\n")
+    w("\n")
 
     # Sort countries by GP rank
-    by_gp = sorted(countries, key=lambda c: c.great_power_rank if c.great_power_rank > 0 else 9999)
+    by_gp = sorted(countries, key=gp_sort_key)
     tags = [c.tag for c in by_gp]
 
     # For each law category, show which law each country has
     for category in sorted(all_categories):
         display_name = LAW_CATEGORIES.get(category, category.replace('_', ' ').title())
 
-        lines.append("-" * W)
-        lines.append(f"{display_name}")
-        lines.append("-" * W)
+        w(DASH55 + "\n")
+        w(f"{display_name}" + "\n")
+        w(DASH55 + "\n")
 
         # Group countries by their law choice
-        law_to_countries = {}
+        law_to_countries = defaultdict(list)
         for c in by_gp:
             law_choice = c.laws.get(category, None)
             if law_choice:
-                if law_choice not in law_to_countries:
-                    law_to_countries[law_choice] = []
                 law_to_countries[law_choice].append(c.tag)
 
         # Display each law option and which countries have it
         for law_choice, ctags in sorted(law_to_countries.items(), key=lambda x: -len(x[1])):
             # Clean up the law name for display
             law_display = law_choice.replace('_', ' ').replace(' policy', '').title()
-            lines.append(f"  {law_display}: {', '.join(ctags)}")
+            w(f"  {law_display}: {', '.join(ctags)}" + "\n")
 
-        lines.append("")
+        w("\n")
 
     # Summary table: laws per country
-    lines.append("=" * W)
-    lines.append("LAWS BY COUNTRY")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("LAWS BY COUNTRY" + "\n")
+    w(DASH55 + "\n")
     for c in by_gp:
-        lines.append(f"\n{c.tag} ({len(c.laws)} laws):")
+        w(f"\n{c.tag} ({len(c.laws)} laws):" + "\n")
         for cat, law in sorted(c.laws.items()):
             cat_display = LAW_CATEGORIES.get(cat, cat.replace('_', ' '))
             law_display = law.replace('_', ' ').title()
-            lines.append(f"  {cat_display}: {law_display}")
+            w(f"  {cat_display}: {law_display}" + "\n")
+
+    w("\n")
+    w(EQ55 + "\n")
+    w("END OF LAWS REPORT" + "\n")
+    w(EQ55 + "\n")
+
+    return buf.getvalue()
+
+
+# Privilege prefix -> estate; compiled into one anchored alternation at
+# import so each classify_privilege call is a single regex match
+PRIVILEGE_ESTATE_PREFIXES = {
+    'nobles_': 'Nobles', 'noble_': 'Nobles', 'auxilium': 'Nobles', 'primacy_of_nobility': 'Nobles',
+    'clergy_': 'Clergy', 'clerical_': 'Clergy', 'embellish_great_works': 'Clergy',
+    'burghers_': 'Burghers', 'burgher_': 'Burghers', 'formal_guilds': 'Burghers',
+    'free_city': 'Burghers', 'polish_merchant': 'Burghers', 'market_fairs': 'Burghers',
+    'treasury_rights': 'Burghers', 'commercial_': 'Burghers', 'control_over_the_coinage': 'Burghers',
+    'peasants_': 'Peasants', 'peasant_': 'Peasants', 'land_owning_farmers': 'Peasants',
+    'dhimmi_': 'Dhimmi', 'jizya': 'Dhimmi',
+    'tribes_': 'Tribes', 'tribal_': 'Tribes', 'expansionist_zealotry': 'Tribes',
+    'cossacks_': 'Cossacks', 'cossack_': 'Cossacks',
+}
+
+_ESTATE_ALTERNATIVES: dict[str, list[str]] = {}
+for _prefix, _estate in PRIVILEGE_ESTATE_PREFIXES.items():
+    _ESTATE_ALTERNATIVES.setdefault(_estate, []).append(re.escape(_prefix))
 
-    lines.append("")
-    lines.append("=" * W)
-    lines.append("END OF LAWS REPORT")
-    lines.append("=" * W)
+# One named group per estate; match.lastgroup names the estate directly
+ESTATE_RE = re.compile('|'.join(
+    f"(?P<{estate}>{'|'.join(alts)})"
+    for estate, alts in _ESTATE_ALTERNATIVES.items()))
 
-    return "\n".join(lines)
 
+_fmt_estate_count = "{}:{}".format
 
+
+@lru_cache(maxsize=None)
+def _priv_display(priv: str) -> str:
+    """Human-readable form of a privilege key, cached per distinct key."""
+    return priv.replace('_', ' ').title()
+
+
+@lru_cache(maxsize=None)
 def classify_privilege(priv: str) -> str:
     """Classify a privilege into an estate category."""
-    if priv.startswith(('nobles_', 'noble_', 'auxilium', 'primacy_of_nobility')):
-        return 'Nobles'
-    elif priv.startswith(('clergy_', 'clerical_', 'embellish_great_works')):
-        return 'Clergy'
-    elif priv.startswith(('burghers_', 'burgher_', 'formal_guilds', 'free_city', 'polish_merchant', 'market_fairs', 'treasury_rights', 'commercial_', 'control_over_the_coinage')):
-        return 'Burghers'
-    elif priv.startswith(('peasants_', 'peasant_', 'land_owning_farmers')):
-        return 'Peasants'
-    elif priv.startswith(('dhimmi_', 'jizya')):
-        return 'Dhimmi'
-    elif priv.startswith(('tribes_', 'tribal_', 'expansionist_zealotry')):
-        return 'Tribes'
-    elif priv.startswith(('cossacks_', 'cossack_')):
-        return 'Cossacks'
-    else:
-        return 'General'
+    match = ESTATE_RE.match(priv)
+    return match.lastgroup if match else 'General'
+
 
+def generate_privileges_report(countries: list[CountryStats], save_date: str) -> Iterator[str]:
+    """Yield the privileges comparison report line by line, grouped by estate.
 
-def generate_privileges_report(countries: list[CountryStats], save_date: str) -> str:
-    """Generate a privileges comparison report grouped by estate."""
-    lines = []
-    W = 55
+    A generator so the caller can stream rows straight to disk without the
+    list + joined-string double buffering the other reports use.
+    """
 
-    lines.append("=" * W)
-    lines.append("EU5 PRIVILEGES COMPARISON")
-    lines.append("=" * W)
-    lines.append(f"Save: {save_date} | Players: {len(countries)}")
-    lines.append("")
+    yield EQ55
+    yield "EU5 PRIVILEGES COMPARISON"
+    yield EQ55
+    yield f"Save: {save_date} | Players: {len(countries)}"
+    yield ""
 
     # Sort countries by GP rank
-    by_gp = sorted(countries, key=lambda c: c.great_power_rank if c.great_power_rank > 0 else 9999)
+    by_gp = sorted(countries, key=gp_sort_key)
 
-    # Collect all privileges by estate
-    estate_privs = {}  # estate -> {priv -> [countries]}
+    # Classify each distinct privilege once; every section below reuses this
+    priv_estate = {priv: classify_privilege(priv) for c in by_gp for priv in c.privileges}
+
+    # Collect all privileges by estate; tally per-country estate counts in
+    # the same pass for the by-country summary below
+    estate_privs = defaultdict(lambda: defaultdict(list))  # estate -> {priv -> [countries]}
+    per_country_estate = defaultdict(Counter)  # tag -> {estate -> count}
     for c in by_gp:
         for priv in c.privileges:
-            estate = classify_privilege(priv)
-            if estate not in estate_privs:
-                estate_privs[estate] = {}
-            if priv not in estate_privs[estate]:
-                estate_privs[estate][priv] = []
+            estate = priv_estate[priv]
             estate_privs[estate][priv].append(c.tag)
+            per_country_estate[c.tag][estate] += 1
+
+    # Alphabetize each estate's privileges once; both sections below start
+    # from this order instead of re-sorting the dicts
+    estate_privs_sorted = {estate: sorted(privs.items())
+                           for estate, privs in estate_privs.items()}
 
     # Define estate order
     estate_order = ['Nobles', 'Clergy', 'Burghers', 'Peasants', 'Dhimmi', 'Tribes', 'Cossacks', 'General']
 
     # For each estate, show privileges and which countries have them
     for estate in estate_order:
-        if estate not in estate_privs:
+        if estate not in estate_privs_sorted:
             continue
 
-        privs = estate_privs[estate]
-        lines.append("=" * W)
-        lines.append(f"{estate.upper()} PRIVILEGES ({len(privs)} unique)")
-        lines.append("=" * W)
+        privs = estate_privs_sorted[estate]
+        yield EQ55
+        yield f"{estate.upper()} PRIVILEGES ({len(privs)} unique)"
+        yield EQ55
 
-        # Sort by number of countries (most common first)
-        for priv, ctags in sorted(privs.items(), key=lambda x: (-len(x[1]), x[0])):
-            priv_display = priv.replace('_', ' ').title()
+        # Most common first; the input is already alphabetical, so a stable
+        # sort on count alone keeps the name tie-break
+        for priv, ctags in sorted(privs, key=lambda x: -len(x[1])):
+            priv_display = _priv_display(priv)
             if len(ctags) == len(by_gp):
                 # All countries have it
-                lines.append(f"  {priv_display}: ALL")
+                yield f"  {priv_display}: ALL"
             else:
-                lines.append(f"  {priv_display}: {', '.join(ctags)}")
+                yield f"  {priv_display}: {', '.join(ctags)}"
 
-        lines.append("")
+        yield ""
 
     # Summary: privilege count by country
-    lines.append("=" * W)
-    lines.append("PRIVILEGES BY COUNTRY")
-    lines.append("-" * W)
+    yield EQ55
+    yield "PRIVILEGES BY COUNTRY"
+    yield DASH55
 
     for c in by_gp:
-        # Count by estate
-        estate_counts = {}
-        for priv in c.privileges:
-            estate = classify_privilege(priv)
-            estate_counts[estate] = estate_counts.get(estate, 0) + 1
+        estate_counts = per_country_estate[c.tag]
 
-        counts_str = ", ".join(f"{e}:{n}" for e, n in sorted(estate_counts.items()) if n > 0)
-        lines.append(f"{c.tag}: {c.num_privileges} total ({counts_str})")
+        # Counter never stores zero counts, so no n > 0 filter is needed
+        counts_str = ", ".join(starmap(_fmt_estate_count, sorted(estate_counts.items())))
+        yield f"{c.tag}: {c.num_privileges} total ({counts_str})"
 
-    lines.append("")
+    yield ""
 
     # Unique privileges (only one country has)
-    lines.append("=" * W)
-    lines.append("UNIQUE PRIVILEGES (only one country)")
-    lines.append("-" * W)
+    yield EQ55
+    yield "UNIQUE PRIVILEGES (only one country)"
+    yield DASH55
 
     unique_found = False
     for estate in estate_order:
-        if estate not in estate_privs:
+        if estate not in estate_privs_sorted:
             continue
-        for priv, ctags in sorted(estate_privs[estate].items()):
+        for priv, ctags in estate_privs_sorted[estate]:
             if len(ctags) == 1:
-                priv_display = priv.replace('_', ' ').title()
-                lines.append(f"  {ctags[0]}: {priv_display}")
+                priv_display = _priv_display(priv)
+                yield f"  {ctags[0]}: {priv_display}"
                 unique_found = True
 
     if not unique_found:
-        lines.append("  (none)")
-
-    lines.append("")
-    lines.append("=" * W)
-    lines.append("END OF PRIVILEGES REPORT")
-    lines.append("=" * W)
-
-    return "\n".join(lines)
+        yield "  (none)"
+
+    yield ""
+    yield EQ55
+    yield "END OF PRIVILEGES REPORT"
+    yield EQ55
+
+
+def _pct_changes(pairs: list[tuple[CountryStats, CountryStats]],
+                 attr: str) -> list[tuple[str, float, float, float, float]]:
+    """Per-pair (tag, old, new, delta, pct) for one attribute, best % first."""
+    get = attrgetter(attr)
+    changes = []
+    for curr, prev in pairs:
+        old, new = get(prev), get(curr)
+        delta = new - old
+        pct = (delta / old * 100) if old > 0 else 0
+        changes.append((curr.tag, old, new, delta, pct))
+    changes.sort(key=itemgetter(4), reverse=True)
+    return changes
+
+
+def _abs_changes(pairs: list[tuple[CountryStats, CountryStats]],
+                 attr: str) -> list[tuple[str, float, float, float]]:
+    """Per-pair (tag, old, new, delta) for one attribute, biggest delta first."""
+    get = attrgetter(attr)
+    changes = [(curr.tag, get(prev), get(curr), get(curr) - get(prev))
+               for curr, prev in pairs]
+    changes.sort(key=itemgetter(3), reverse=True)
+    return changes
 
 
 def generate_comparison_report(current: list[CountryStats], previous: list[CountryStats],
@@ -1285,8 +1462,8 @@ def generate_comparison_report(current: list[CountryStats], previous: list[Count
         player_matches: Optional list of (current_tag, previous_tag) tuples for
                        players who changed tags (e.g., POL -> PLC)
     """
-    lines = []
-    W = 55
+    buf = io.StringIO()
+    w = buf.write
 
     # Build lookup by tag
     prev_lookup = {c.tag: c for c in previous}
@@ -1316,44 +1493,26 @@ def generate_comparison_report(current: list[CountryStats], previous: list[Count
     # Sort by current GP rank
     countries_to_compare.sort(key=lambda x: x[0].great_power_rank if x[0].great_power_rank > 0 else 9999)
 
-    lines.append("=" * W)
-    lines.append("SESSION COMPARISON REPORT")
-    lines.append("=" * W)
-    lines.append(f"Previous: {previous_date}")
-    lines.append(f"Current:  {current_date}")
-    lines.append(f"Players:  {len(countries_to_compare)}")
+    w(EQ55 + "\n")
+    w("SESSION COMPARISON REPORT" + "\n")
+    w(EQ55 + "\n")
+    w(f"Previous: {previous_date}" + "\n")
+    w(f"Current:  {current_date}" + "\n")
+    w(f"Players:  {len(countries_to_compare)}" + "\n")
 
     # Show any tag changes
     tag_changes = [(curr.tag, prev.tag) for curr, prev in countries_to_compare if curr.tag != prev.tag]
     if tag_changes:
-        lines.append("")
-        lines.append("Tag changes:")
+        w("\n")
+        w("Tag changes:" + "\n")
         for new_tag, old_tag in tag_changes:
-            lines.append(f"  {old_tag} → {new_tag}")
-    lines.append("")
-
-    def fmt_tag(curr_tag: str, prev_tag: str) -> str:
-        """Format tag, showing old tag if different."""
-        if curr_tag != prev_tag:
-            return f"{curr_tag}←{prev_tag}"
-        return curr_tag
-
-    def fmt_delta(val: float, precision: int = 0) -> str:
-        """Format a delta value with + or - prefix."""
-        if precision == 0:
-            return f"+{val:.0f}" if val >= 0 else f"{val:.0f}"
-        return f"+{val:.{precision}f}" if val >= 0 else f"{val:.{precision}f}"
-
-    def fmt_pop_delta(val: float) -> str:
-        """Format population delta (in thousands -> display as K or M)."""
-        if abs(val) >= 1000:
-            return f"+{val/1000:.2f}M" if val >= 0 else f"{val/1000:.2f}M"
-        return f"+{val:.1f}K" if val >= 0 else f"{val:.1f}K"
+            w(f"  {old_tag} → {new_tag}" + "\n")
+    w("\n")
 
     # === GREAT POWER RANK CHANGES ===
-    lines.append("=" * W)
-    lines.append("GREAT POWER RANK CHANGES")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("GREAT POWER RANK CHANGES" + "\n")
+    w(DASH55 + "\n")
 
     rank_changes = []
     for curr, prev in countries_to_compare:
@@ -1361,7 +1520,7 @@ def generate_comparison_report(current: list[CountryStats], previous: list[Count
             change = prev.great_power_rank - curr.great_power_rank  # Positive = improved
             rank_changes.append((curr.tag, prev.great_power_rank, curr.great_power_rank, change))
 
-    rank_changes.sort(key=lambda x: -x[3])  # Best improvement first
+    rank_changes.sort(key=itemgetter(3), reverse=True)  # Best improvement first
     for tag, old_rank, new_rank, change in rank_changes:
         if change > 0:
             symbol = f"↑{change}"
@@ -1369,171 +1528,137 @@ def generate_comparison_report(current: list[CountryStats], previous: list[Count
             symbol = f"↓{-change}"
         else:
             symbol = "="
-        lines.append(f"  {tag:<5} #{old_rank} → #{new_rank}  ({symbol})")
-    lines.append("")
+        w(f"  {tag:<5} #{old_rank} → #{new_rank}  ({symbol})" + "\n")
+    w("\n")
 
     # === POPULATION CHANGES ===
-    lines.append("=" * W)
-    lines.append("POPULATION GROWTH")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}")
-    lines.append("-" * W)
-
-    pop_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.population - prev.population
-        pct = (delta / prev.population * 100) if prev.population > 0 else 0
-        pop_changes.append((curr.tag, prev.population, curr.population, delta, pct))
-
-    pop_changes.sort(key=lambda x: -x[4])  # Best % growth first
+    w(EQ55 + "\n")
+    w("POPULATION GROWTH" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}" + "\n")
+    w(DASH55 + "\n")
+
+    pop_changes = _pct_changes(countries_to_compare, 'population')
+    row = "{:<5}{:<10}{:<10}{:<10}{}%\n".format
     for tag, old_pop, new_pop, delta, pct in pop_changes:
-        lines.append(f"{tag:<5}{fmt_pop(old_pop):<10}{fmt_pop(new_pop):<10}{fmt_pop_delta(delta):<10}{fmt_delta(pct, 1)}%")
-    lines.append("")
+        w(row(tag, fmt_pop(old_pop), fmt_pop(new_pop), fmt_pop_delta(delta), fmt_delta(pct, 1)))
+    w("\n")
 
     # === TAX BASE CHANGES ===
-    lines.append("=" * W)
-    lines.append("TAX BASE GROWTH")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}")
-    lines.append("-" * W)
-
-    tax_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.current_tax_base - prev.current_tax_base
-        pct = (delta / prev.current_tax_base * 100) if prev.current_tax_base > 0 else 0
-        tax_changes.append((curr.tag, prev.current_tax_base, curr.current_tax_base, delta, pct))
-
-    tax_changes.sort(key=lambda x: -x[4])  # Best % growth first
+    w(EQ55 + "\n")
+    w("TAX BASE GROWTH" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}" + "\n")
+    w(DASH55 + "\n")
+
+    tax_changes = _pct_changes(countries_to_compare, 'current_tax_base')
+    row = "{:<5}{:<10}{:<10}{:<10}{}%\n".format
     for tag, old_tax, new_tax, delta, pct in tax_changes:
-        lines.append(f"{tag:<5}{fmt_num(old_tax):<10}{fmt_num(new_tax):<10}{fmt_delta(delta):<10}{fmt_delta(pct, 1)}%")
-    lines.append("")
+        w(row(tag, fmt_num(old_tax), fmt_num(new_tax), fmt_delta(delta), fmt_delta(pct, 1)))
+    w("\n")
 
     # === INCOME CHANGES ===
-    lines.append("=" * W)
-    lines.append("MONTHLY INCOME CHANGES")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}")
-    lines.append("-" * W)
-
-    income_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.monthly_income - prev.monthly_income
-        pct = (delta / prev.monthly_income * 100) if prev.monthly_income > 0 else 0
-        income_changes.append((curr.tag, prev.monthly_income, curr.monthly_income, delta, pct))
-
-    income_changes.sort(key=lambda x: -x[4])
+    w(EQ55 + "\n")
+    w("MONTHLY INCOME CHANGES" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}" + "\n")
+    w(DASH55 + "\n")
+
+    income_changes = _pct_changes(countries_to_compare, 'monthly_income')
+    row = "{:<5}{:<10}{:<10}{:<10}{}%\n".format
     for tag, old_inc, new_inc, delta, pct in income_changes:
-        lines.append(f"{tag:<5}{fmt_num(old_inc):<10}{fmt_num(new_inc):<10}{fmt_delta(delta):<10}{fmt_delta(pct, 1)}%")
-    lines.append("")
+        w(row(tag, fmt_num(old_inc), fmt_num(new_inc), fmt_delta(delta), fmt_delta(pct, 1)))
+    w("\n")
 
     # === TREASURY CHANGES ===
-    lines.append("=" * W)
-    lines.append("TREASURY CHANGES")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<12}")
-    lines.append("-" * W)
-
-    treasury_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.gold - prev.gold
-        treasury_changes.append((curr.tag, prev.gold, curr.gold, delta))
-
-    treasury_changes.sort(key=lambda x: -x[3])
+    w(EQ55 + "\n")
+    w("TREASURY CHANGES" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<12}" + "\n")
+    w(DASH55 + "\n")
+
+    treasury_changes = _abs_changes(countries_to_compare, 'gold')
+    row = "{:<5}{:<10}{:<10}{}\n".format
     for tag, old_gold, new_gold, delta in treasury_changes:
-        lines.append(f"{tag:<5}{fmt_num(old_gold):<10}{fmt_num(new_gold):<10}{fmt_delta(delta)}")
-    lines.append("")
+        w(row(tag, fmt_num(old_gold), fmt_num(new_gold), fmt_delta(delta)))
+    w("\n")
 
     # === MILITARY CHANGES ===
-    lines.append("=" * W)
-    lines.append("MILITARY CHANGES (Regiments)")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}")
-    lines.append("-" * W)
-
-    mil_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.num_subunits - prev.num_subunits
-        mil_changes.append((curr.tag, prev.num_subunits, curr.num_subunits, delta))
-
-    mil_changes.sort(key=lambda x: -x[3])
+    w(EQ55 + "\n")
+    w("MILITARY CHANGES (Regiments)" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}" + "\n")
+    w(DASH55 + "\n")
+
+    mil_changes = _abs_changes(countries_to_compare, 'num_subunits')
+    row = "{:<5}{:<10}{:<10}{}\n".format
     for tag, old_mil, new_mil, delta in mil_changes:
-        lines.append(f"{tag:<5}{old_mil:<10}{new_mil:<10}{fmt_delta(delta)}")
-    lines.append("")
+        w(row(tag, old_mil, new_mil, fmt_delta(delta)))
+    w("\n")
 
     # === MANPOWER CHANGES ===
-    lines.append("=" * W)
-    lines.append("MAX MANPOWER CHANGES")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}")
-    lines.append("-" * W)
-
-    mp_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.max_manpower - prev.max_manpower
-        pct = (delta / prev.max_manpower * 100) if prev.max_manpower > 0 else 0
-        mp_changes.append((curr.tag, prev.max_manpower, curr.max_manpower, delta, pct))
-
-    mp_changes.sort(key=lambda x: -x[4])
+    w(EQ55 + "\n")
+    w("MAX MANPOWER CHANGES" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Previous':<10}{'Current':<10}{'Delta':<10}{'%':<8}" + "\n")
+    w(DASH55 + "\n")
+
+    mp_changes = _pct_changes(countries_to_compare, 'max_manpower')
+    row = "{:<5}{:<10.1f}{:<10.1f}{:<10}{}%\n".format
     for tag, old_mp, new_mp, delta, pct in mp_changes:
-        lines.append(f"{tag:<5}{old_mp:<10.1f}{new_mp:<10.1f}{fmt_delta(delta, 1):<10}{fmt_delta(pct, 1)}%")
-    lines.append("")
+        w(row(tag, old_mp, new_mp, fmt_delta(delta, 1), fmt_delta(pct, 1)))
+    w("\n")
 
     # === TECHNOLOGY CHANGES ===
-    lines.append("=" * W)
-    lines.append("TECHNOLOGY ADVANCES GAINED")
-    lines.append("-" * W)
-
-    tech_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.num_researched_advances - prev.num_researched_advances
-        tech_changes.append((curr.tag, prev.num_researched_advances, curr.num_researched_advances, delta))
+    w(EQ55 + "\n")
+    w("TECHNOLOGY ADVANCES GAINED" + "\n")
+    w(DASH55 + "\n")
 
-    tech_changes.sort(key=lambda x: -x[3])  # Sort by advances gained
+    tech_changes = _abs_changes(countries_to_compare, 'num_researched_advances')
     for tag, old_adv, new_adv, delta in tech_changes:
-        lines.append(f"  {tag:<5} {old_adv} → {new_adv}  ({fmt_delta(delta)} advances)")
-    lines.append("")
+        w(f"  {tag:<5} {old_adv} → {new_adv}  ({fmt_delta(delta)} advances)" + "\n")
+    w("\n")
 
     # === PROVINCE CHANGES ===
-    lines.append("=" * W)
-    lines.append("TERRITORY CHANGES (Provinces)")
-    lines.append("-" * W)
-
-    prov_changes = []
-    for curr, prev in countries_to_compare:
-        delta = curr.num_provinces - prev.num_provinces
-        prov_changes.append((curr.tag, prev.num_provinces, curr.num_provinces, delta))
+    w(EQ55 + "\n")
+    w("TERRITORY CHANGES (Provinces)" + "\n")
+    w(DASH55 + "\n")
 
-    prov_changes.sort(key=lambda x: -x[3])
+    prov_changes = _abs_changes(countries_to_compare, 'num_provinces')
+    # Most sessions leave most borders alone; collapse those into one line
+    unchanged = []
     for tag, old_prov, new_prov, delta in prov_changes:
         if delta != 0:
-            lines.append(f"  {tag:<5} {old_prov} → {new_prov}  ({fmt_delta(delta)} provinces)")
+            w(f"  {tag:<5} {old_prov} → {new_prov}  ({fmt_delta(delta)} provinces)" + "\n")
         else:
-            lines.append(f"  {tag:<5} {old_prov} → {new_prov}  (unchanged)")
-    lines.append("")
+            unchanged.append(tag)
+    if unchanged:
+        w(f"  Unchanged: {', '.join(unchanged)}" + "\n")
+    w("\n")
 
     # === STABILITY/PRESTIGE ===
-    lines.append("=" * W)
-    lines.append("STABILITY & PRESTIGE")
-    lines.append("-" * W)
-    lines.append(f"{'Tag':<5}{'Stab Δ':<10}{'Prest Δ':<10}{'ArmyT Δ':<10}{'NavyT Δ':<10}")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("STABILITY & PRESTIGE" + "\n")
+    w(DASH55 + "\n")
+    w(f"{'Tag':<5}{'Stab Δ':<10}{'Prest Δ':<10}{'ArmyT Δ':<10}{'NavyT Δ':<10}" + "\n")
+    w(DASH55 + "\n")
 
+    row = "{:<5}{:<10}{:<10}{:<10}{:<10}\n".format
     for curr, prev in countries_to_compare:
         stab_d = curr.stability - prev.stability
         pres_d = curr.prestige - prev.prestige
         army_d = curr.army_tradition - prev.army_tradition
         navy_d = curr.navy_tradition - prev.navy_tradition
-        lines.append(f"{curr.tag:<5}{fmt_delta(stab_d, 1):<10}{fmt_delta(pres_d, 1):<10}{fmt_delta(army_d, 1):<10}{fmt_delta(navy_d, 1):<10}")
-    lines.append("")
+        w(row(curr.tag, fmt_delta(stab_d, 1), fmt_delta(pres_d, 1), fmt_delta(army_d, 1), fmt_delta(navy_d, 1)))
+    w("\n")
 
     # === SUBJECT CHANGES ===
     # Check if any country has subjects in either save
-    has_subjects = any(len(c.subjects) > 0 for c, _ in countries_to_compare) or \
-                   any(len(p.subjects) > 0 for _, p in countries_to_compare)
+    has_subjects = any(c.subjects or p.subjects for c, p in countries_to_compare)
     if has_subjects:
-        lines.append("=" * W)
-        lines.append("SUBJECT CHANGES")
-        lines.append("-" * W)
+        w(EQ55 + "\n")
+        w("SUBJECT CHANGES" + "\n")
+        w(DASH55 + "\n")
 
         for curr, prev in countries_to_compare:
             curr_subjs = set(curr.subjects)
@@ -1542,50 +1667,51 @@ def generate_comparison_report(current: list[CountryStats], previous: list[Count
             lost = prev_subjs - curr_subjs
 
             if gained or lost:
-                lines.append(f"{curr.tag}:")
+                w(f"{curr.tag}:" + "\n")
                 if gained:
-                    lines.append(f"  Gained: {', '.join(gained)}")
+                    w(f"  Gained: {', '.join(gained)}" + "\n")
                 if lost:
-                    lines.append(f"  Lost: {', '.join(lost)}")
-        lines.append("")
+                    w(f"  Lost: {', '.join(lost)}" + "\n")
+        w("\n")
 
     # === SUMMARY: BIGGEST GAINERS ===
-    lines.append("=" * W)
-    lines.append("SESSION MVPs")
-    lines.append("-" * W)
+    w(EQ55 + "\n")
+    w("SESSION MVPs" + "\n")
+    w(DASH55 + "\n")
 
-    # Find leaders in each category
+    # The change lists are already sorted best-first by the same key each
+    # max() used, so the leader is just the head of each list
     if pop_changes:
-        best_pop = max(pop_changes, key=lambda x: x[4])
-        lines.append(f"  Pop Growth:  {best_pop[0]} ({fmt_delta(best_pop[4], 1)}%)")
+        best_pop = pop_changes[0]
+        w(f"  Pop Growth:  {best_pop[0]} ({fmt_delta(best_pop[4], 1)}%)" + "\n")
 
     if tax_changes:
-        best_tax = max(tax_changes, key=lambda x: x[4])
-        lines.append(f"  Tax Growth:  {best_tax[0]} ({fmt_delta(best_tax[4], 1)}%)")
+        best_tax = tax_changes[0]
+        w(f"  Tax Growth:  {best_tax[0]} ({fmt_delta(best_tax[4], 1)}%)" + "\n")
 
     if income_changes:
-        best_inc = max(income_changes, key=lambda x: x[4])
-        lines.append(f"  Income Growth: {best_inc[0]} ({fmt_delta(best_inc[4], 1)}%)")
+        best_inc = income_changes[0]
+        w(f"  Income Growth: {best_inc[0]} ({fmt_delta(best_inc[4], 1)}%)" + "\n")
 
     if mil_changes:
-        best_mil = max(mil_changes, key=lambda x: x[3])
-        lines.append(f"  Military:    {best_mil[0]} ({fmt_delta(best_mil[3])} regiments)")
+        best_mil = mil_changes[0]
+        w(f"  Military:    {best_mil[0]} ({fmt_delta(best_mil[3])} regiments)" + "\n")
 
     if tech_changes:
-        best_tech = max(tech_changes, key=lambda x: x[3])
-        lines.append(f"  Tech:        {best_tech[0]} ({fmt_delta(best_tech[3])} advances)")
+        best_tech = tech_changes[0]
+        w(f"  Tech:        {best_tech[0]} ({fmt_delta(best_tech[3])} advances)" + "\n")
 
     if prov_changes:
-        best_prov = max(prov_changes, key=lambda x: x[3])
+        best_prov = prov_changes[0]
         if best_prov[3] > 0:
-            lines.append(f"  Expansion:   {best_prov[0]} ({fmt_delta(best_prov[3])} provinces)")
+            w(f"  Expansion:   {best_prov[0]} ({fmt_delta(best_prov[3])} provinces)" + "\n")
 
-    lines.append("")
-    lines.append("=" * W)
-    lines.append("END OF COMPARISON REPORT")
-    lines.append("=" * W)
+    w("\n")
+    w(EQ55 + "\n")
+    w("END OF COMPARISON REPORT" + "\n")
+    w(EQ55 + "\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def main():
@@ -1596,6 +1722,8 @@ def main():
     parser.add_argument('-o', '--output', help='Output directory (default: reports/)')
     parser.add_argument('--no-timestamp', action='store_true', help='Don\'t create timestamped subfolder')
     parser.add_argument('--compare', help='Previous save file to compare against')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='Print per-stage progress on stderr')
     args = parser.parse_args()
 
     # Find save file
@@ -1603,12 +1731,21 @@ def main():
         save_file = Path(args.save_file)
     else:
         save_dir = SCRIPT_DIR / "save"
-        save_files = sorted(save_dir.glob("*.eu5"), key=lambda f: f.stat().st_mtime, reverse=True)
-        if not save_files:
+        # One scandir pass tracking the max mtime: no Path object per
+        # unrelated entry and no sort just to take the newest
+        save_file = None
+        newest = -1.0
+        with os.scandir(save_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith('.eu5') and entry.stat().st_mtime > newest:
+                    newest = entry.stat().st_mtime
+                    save_file = Path(entry.path)
+        if save_file is None:
             print("No .eu5 save files found")
             sys.exit(1)
-        save_file = save_files[0]
-    save_date = get_save_date(str(save_file))
+    # Every lookup helper takes a str path; convert the Path once
+    save_path = os.fspath(save_file)
+    save_date = get_save_date(save_path)
 
     # Determine output directory
     if args.output:
@@ -1618,164 +1755,180 @@ def main():
 
     # Create timestamped subfolder unless disabled
     if not args.no_timestamp:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         save_date_clean = save_date.replace('.', '_')
         report_dir = report_dir / f"{save_date_clean}_{timestamp}"
 
     report_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"Loading: {save_file.name}", file=sys.stderr)
-    print(f"Output: {report_dir}", file=sys.stderr)
-
-    countries = []
-    for player_tags in PLAYER_TAGS:
-        # Try each tag in the player's tag list (newest/formed nation first)
-        found = False
-        for tag in reversed(player_tags):
-            print(f"  Parsing {tag}...", file=sys.stderr, end=" ", flush=True)
-            country_text = find_country_in_file(str(save_file), tag)
-
-            if country_text:
-                stats = parse_country(country_text, tag)
-
-                # Get ruler stats
-                if stats.ruler_id:
-                    ruler = find_character(str(save_file), stats.ruler_id)
-                    if ruler:
-                        stats.ruler_adm = int(ruler['adm'])
-                        stats.ruler_dip = int(ruler['dip'])
-                        stats.ruler_mil = int(ruler['mil'])
-                        stats.ruler_name = ruler['first_name'].replace('name_', '').title()
-                        stats.ruler_traits = ruler.get('traits', [])
-                        stats.ruler_birth_date = ruler.get('birth_date', '')
-                        if stats.ruler_birth_date:
-                            stats.ruler_age = calculate_age(stats.ruler_birth_date, save_date)
-
-                # Get regent stats if in regency
-                if stats.regent_id:
-                    regent = find_character(str(save_file), stats.regent_id)
-                    if regent:
-                        stats.regent_adm = int(regent['adm'])
-                        stats.regent_dip = int(regent['dip'])
-                        stats.regent_mil = int(regent['mil'])
-                        stats.regent_name = regent['first_name'].replace('name_', '').title()
-                        if regent.get('birth_date'):
-                            stats.regent_age = calculate_age(regent['birth_date'], save_date)
-
+    # Progress chatter costs a flushed stderr syscall per call; off by default
+    if args.verbose:
+        def progress(*print_args, **print_kwargs):
+            print(*print_args, file=sys.stderr, **print_kwargs)
+    else:
+        def progress(*print_args, **print_kwargs):
+            pass
+
+    progress(f"Loading: {save_file.name}")
+    progress(f"Output: {report_dir}")
+
+    # Re-runs against the same save (typical when iterating on report
+    # formatting) skip the parse entirely: the enriched countries list is
+    # cached on disk keyed by the save file's name, mtime, size and roster
+    stat = save_file.stat()
+    cache_file = SCRIPT_DIR / "reports" / ".cache" / \
+        f"{save_file.name}_{stat.st_mtime_ns}_{stat.st_size}_{ROSTER_KEY}.pkl"
+    countries = None
+    if cache_file.exists():
+        try:
+            countries = pickle.loads(cache_file.read_bytes())
+            progress(f"  Loaded {len(countries)} countries from cache")
+        except Exception:
+            countries = None
+
+    if countries is None:
+        # parse_country is pure CPU over an independent slice of the save, so fan
+        # the per-player work out across cores; each worker mmaps the file itself
+        # (a page-cache hit) and parses only its own blocks
+        progress(f"  Parsing {len(PLAYER_TAGS)} players...", end=" ", flush=True)
+        jobs = [(save_path, player_tags, save_date) for player_tags in PLAYER_TAGS]
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(parse_player, jobs))
+        progress("OK")
+
+        countries = []
+        for player_tags, stats in zip(PLAYER_TAGS, results):
+            if stats is not None:
                 countries.append(stats)
-                print("OK", file=sys.stderr)
-                found = True
-                break
             else:
-                print("not found, ", file=sys.stderr, end="")
+                print(f"  NOT FOUND (tried: {', '.join(player_tags)})", file=sys.stderr)
 
-        if not found:
-            print(f"NOT FOUND (tried: {', '.join(player_tags)})", file=sys.stderr)
+        if countries:
+            # Great-power order is what every report leads with; sort once here so
+            # the per-report gp_sort_key sorts see already-ordered input
+            countries.sort(key=gp_sort_key)
+
+            # Calculate control values from locations data
+            progress("  Calculating control...", end=" ", flush=True)
+            control_data = calculate_average_control(save_path, [c.tag for c in countries])
+            for c in countries:
+                c.average_control = control_data.get(c.tag, 0.0)
+            progress("OK")
+
+            # Extract subject relationships
+            progress("  Finding subjects...", end=" ", flush=True)
+            subjects_map = get_subjects_for_countries(save_path, [c.tag for c in countries])
+
+            # Parse subject country data
+            all_subject_tags = set()
+            for subj_list in subjects_map.values():
+                all_subject_tags.update(subj_list)
+
+            subject_texts = find_countries_in_file(save_path, all_subject_tags)
+            subject_stats = {subj_tag: parse_country(subj_text, subj_tag)
+                             for subj_tag, subj_text in subject_texts.items()}
+
+            # Attach subjects to their overlords and calculate totals
+            for c in countries:
+                c.subjects = subjects_map.get(c.tag, [])
+                c.subject_data = [subject_stats[t] for t in c.subjects if t in subject_stats]
+
+                # Calculate totals (self + subjects)
+                c.total_population = c.population + sum(s.population for s in c.subject_data)
+                c.total_tax_base = c.current_tax_base + sum(s.current_tax_base for s in c.subject_data)
+                c.total_regiments = c.num_subunits + sum(s.num_subunits for s in c.subject_data)
+                c.total_manpower = c.max_manpower + sum(s.max_manpower for s in c.subject_data)
+
+            total_subjects = sum(len(c.subjects) for c in countries)
+            progress(f"OK ({total_subjects} subjects found)")
+
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(pickle.dumps(countries, protocol=pickle.HIGHEST_PROTOCOL))
+
+    print(f"Parsed {len(countries)}/{len(PLAYER_TAGS)} players from {save_file.name}",
+          file=sys.stderr)
 
     if countries:
-        # Calculate control values from locations data
-        print("  Calculating control...", file=sys.stderr, end=" ", flush=True)
-        control_data = calculate_average_control(str(save_file), [c.tag for c in countries])
-        for c in countries:
-            c.average_control = control_data.get(c.tag, 0.0)
-        print("OK", file=sys.stderr)
-
-        # Extract subject relationships
-        print("  Finding subjects...", file=sys.stderr, end=" ", flush=True)
-        subjects_map = get_subjects_for_countries(str(save_file), [c.tag for c in countries])
-
-        # Parse subject country data
-        all_subject_tags = set()
-        for subj_list in subjects_map.values():
-            all_subject_tags.update(subj_list)
-
-        subject_stats = {}
-        for subj_tag in all_subject_tags:
-            subj_text = find_country_in_file(str(save_file), subj_tag)
-            if subj_text:
-                subject_stats[subj_tag] = parse_country(subj_text, subj_tag)
-
-        # Attach subjects to their overlords and calculate totals
-        for c in countries:
-            c.subjects = subjects_map.get(c.tag, [])
-            c.subject_data = [subject_stats[t] for t in c.subjects if t in subject_stats]
-
-            # Calculate totals (self + subjects)
-            c.total_population = c.population + sum(s.population for s in c.subject_data)
-            c.total_tax_base = c.current_tax_base + sum(s.current_tax_base for s in c.subject_data)
-            c.total_regiments = c.num_subunits + sum(s.num_subunits for s in c.subject_data)
-            c.total_manpower = c.max_manpower + sum(s.max_manpower for s in c.subject_data)
-
-        total_subjects = sum(len(c.subjects) for c in countries)
-        print(f"OK ({total_subjects} subjects found)", file=sys.stderr)
-
-        # Write summary report (Discord-friendly)
-        summary_file = report_dir / "session_summary.txt"
-        with open(summary_file, 'w') as f:
-            f.write(generate_summary_report(countries, save_date))
-        print(f"Summary saved to: {summary_file}", file=sys.stderr)
-
-        # Write detailed profiles (separate file for upload)
-        details_file = report_dir / "country_details.txt"
-        with open(details_file, 'w') as f:
-            f.write(generate_detailed_profiles(countries, save_date))
-        print(f"Details saved to: {details_file}", file=sys.stderr)
-
-        # Write laws comparison report
-        laws_file = report_dir / "laws_comparison.txt"
-        with open(laws_file, 'w') as f:
-            f.write(generate_laws_report(countries, save_date))
-        print(f"Laws saved to: {laws_file}", file=sys.stderr)
-
-        # Write privileges comparison report
-        privs_file = report_dir / "privileges_comparison.txt"
-        with open(privs_file, 'w') as f:
-            f.write(generate_privileges_report(countries, save_date))
-        print(f"Privileges saved to: {privs_file}", file=sys.stderr)
+        # The four reports are independent pure functions of `countries`, so
+        # build and write them on worker threads: generation overlaps with
+        # the open/write/close syscalls of the other files
+        reports = [
+            ("session_summary.txt", "Summary", generate_summary_report),
+            ("country_details.txt", "Details", generate_detailed_profiles),
+            ("laws_comparison.txt", "Laws", generate_laws_report),
+            ("privileges_comparison.txt", "Privileges", generate_privileges_report),
+        ]
+
+        def build_and_write(job):
+            filename, label, build = job
+            out_file = report_dir / filename
+            report = build(countries, save_date)
+            if isinstance(report, str):
+                # One write_text call hands the whole report to the OS in a
+                # single write instead of chunking through the 8 KiB buffer
+                out_file.write_text(report)
+            else:
+                # Generator builders stream rows through one large buffer
+                # without ever materializing the full report string
+                with open(out_file, 'w', buffering=1 << 17) as f:
+                    f.writelines(f"{line}\n" for line in report)
+            return label, out_file
+
+        with ThreadPoolExecutor(max_workers=len(reports)) as pool:
+            for label, out_file in pool.map(build_and_write, reports):
+                print(f"{label} saved to: {out_file}", file=sys.stderr)
 
         # Generate comparison report if previous save provided
         if args.compare:
             prev_file = Path(args.compare)
             if prev_file.exists():
-                print(f"  Loading previous save for comparison...", file=sys.stderr)
-                prev_date = get_save_date(str(prev_file))
-
-                # For each player, find their tag in the previous save
-                # This handles tag changes (e.g., POL -> PLC)
-                prev_countries = []
-                player_matches = []  # List of (current_tag, previous_tag) for tag changes
-
-                for player_tags in PLAYER_TAGS:
-                    # Find which tag this player has in previous save
-                    prev_tag = None
-                    for tag in reversed(player_tags):  # Try newest first
-                        country_text = find_country_in_file(str(prev_file), tag)
-                        if country_text:
-                            prev_tag = tag
-                            stats = parse_country(country_text, tag)
-                            prev_countries.append(stats)
-                            break
-
-                    # Find which tag this player has in current save
-                    curr_tag = None
-                    for c in countries:
-                        if c.tag in player_tags:
-                            curr_tag = c.tag
-                            break
-
-                    # Record the match if both exist (even if same tag)
-                    if curr_tag and prev_tag:
-                        player_matches.append((curr_tag, prev_tag))
+                progress(f"  Loading previous save for comparison...")
+                prev_path = os.fspath(prev_file)
+                prev_date = get_save_date(prev_path)
+
+                # The previous save never changes between runs, so its
+                # parsed players cache just like the current save's
+                prev_stat = prev_file.stat()
+                prev_cache = SCRIPT_DIR / "reports" / ".cache" / \
+                    f"{prev_file.name}_{prev_stat.st_mtime_ns}_{prev_stat.st_size}_{ROSTER_KEY}.pkl"
+                prev_countries = None
+                if prev_cache.exists():
+                    try:
+                        prev_countries = pickle.loads(prev_cache.read_bytes())
+                    except Exception:
+                        prev_countries = None
+
+                if prev_countries is None:
+                    # For each player, find their tag in the previous save
+                    # This handles tag changes (e.g., POL -> PLC)
+                    prev_countries = []
+                    for player_tags in PLAYER_TAGS:
+                        for tag in reversed(player_tags):  # Try newest first
+                            country_text = find_country_in_file(prev_path, tag)
+                            if country_text:
+                                prev_countries.append(parse_country(country_text, tag))
+                                break
+
+                    if prev_countries:
+                        # Get subjects for previous save
+                        prev_subjects_map = get_subjects_for_countries(prev_path, [c.tag for c in prev_countries])
+                        for c in prev_countries:
+                            c.subjects = prev_subjects_map.get(c.tag, [])
+                        prev_cache.parent.mkdir(parents=True, exist_ok=True)
+                        prev_cache.write_bytes(pickle.dumps(prev_countries, protocol=pickle.HIGHEST_PROTOCOL))
 
                 if prev_countries:
-                    # Get subjects for previous save
-                    prev_subjects_map = get_subjects_for_countries(str(prev_file), [c.tag for c in prev_countries])
-                    for c in prev_countries:
-                        c.subjects = prev_subjects_map.get(c.tag, [])
+                    # Match each player's tags across the two saves
+                    prev_tags = {c.tag for c in prev_countries}
+                    player_matches = []  # List of (current_tag, previous_tag) for tag changes
+                    for player_tags in PLAYER_TAGS:
+                        prev_tag = next((t for t in reversed(player_tags) if t in prev_tags), None)
+                        curr_tag = next((c.tag for c in countries if c.tag in player_tags), None)
+                        if curr_tag and prev_tag:
+                            player_matches.append((curr_tag, prev_tag))
 
                     comparison_file = report_dir / "comparison_report.txt"
-                    with open(comparison_file, 'w') as f:
-                        f.write(generate_comparison_report(countries, prev_countries, save_date, prev_date, player_matches))
+                    comparison_file.write_text(generate_comparison_report(countries, prev_countries, save_date, prev_date, player_matches))
                     print(f"Comparison saved to: {comparison_file}", file=sys.stderr)
             else:
                 print(f"Warning: Previous save not found: {prev_file}", file=sys.stderr)
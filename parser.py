@@ -3,27 +3,56 @@ PDX Script Parser for EU5 save files.
 Parses the Paradox script format into Python data structures.
 """
 
+import mmap
 import re
 from typing import Any, Iterator
 
 
+def _coerce(ident: str) -> Any:
+    """Convert an unquoted token to bool/int/float, or leave it a string."""
+    if ident == 'yes':
+        return True
+    if ident == 'no':
+        return False
+    try:
+        if '.' in ident:
+            return float(ident)
+        return int(ident)
+    except ValueError:
+        return ident
+
+
+# Structural bytes compared against in the scanner loops
+_QUOTE, _OPEN, _CLOSE, _EQ, _HASH, _BSLASH, _NL = b'"{}=#\\\n'
+
+# 256-entry class tables: one index per byte instead of a membership scan
+_WS_TABLE = bytes(1 if b in b' \t\n\r' else 0 for b in range(256))
+_IDENT_STOP_TABLE = bytes(1 if b in b' \t\n\r={}#' else 0 for b in range(256))
+
+
 class PDXParser:
     """Parser for Paradox script format (used in EU5 melted saves)."""
 
-    def __init__(self, text: str):
+    def __init__(self, text: str | bytes):
         self.text = text
+        # Scan over UTF-8 bytes: indexing yields ints, which compare far
+        # cheaper than the one-char strings a str scan materializes. All
+        # structural characters are ASCII, so byte offsets are safe; the
+        # leaf slices are decoded back to str on return. Callers that
+        # already hold raw bytes can pass them straight in.
+        self.buf = text if isinstance(text, bytes) else text.encode('utf-8')
         self.pos = 0
-        self.length = len(text)
+        self.length = len(self.buf)
 
     def skip_whitespace(self):
         """Skip whitespace and comments."""
         while self.pos < self.length:
-            c = self.text[self.pos]
-            if c in ' \t\n\r':
+            c = self.buf[self.pos]
+            if _WS_TABLE[c]:
                 self.pos += 1
-            elif c == '#':
+            elif c == _HASH:
                 # Skip comment until end of line
-                while self.pos < self.length and self.text[self.pos] != '\n':
+                while self.pos < self.length and self.buf[self.pos] != _NL:
                     self.pos += 1
             else:
                 break
@@ -33,19 +62,19 @@ class PDXParser:
         self.skip_whitespace()
         if self.pos >= self.length:
             return None
-        return self.text[self.pos]
+        return chr(self.buf[self.pos])
 
     def parse_string(self) -> str:
         """Parse a quoted string."""
-        assert self.text[self.pos] == '"'
+        assert self.buf[self.pos] == _QUOTE
         self.pos += 1
         start = self.pos
-        while self.pos < self.length and self.text[self.pos] != '"':
-            if self.text[self.pos] == '\\':
+        while self.pos < self.length and self.buf[self.pos] != _QUOTE:
+            if self.buf[self.pos] == _BSLASH:
                 self.pos += 2  # Skip escaped character
             else:
                 self.pos += 1
-        result = self.text[start:self.pos]
+        result = self.buf[start:self.pos].decode('utf-8', 'replace')
         self.pos += 1  # Skip closing quote
         return result
 
@@ -53,11 +82,10 @@ class PDXParser:
         """Parse an identifier or unquoted value."""
         start = self.pos
         while self.pos < self.length:
-            c = self.text[self.pos]
-            if c in ' \t\n\r={}#':
+            if _IDENT_STOP_TABLE[self.buf[self.pos]]:
                 break
             self.pos += 1
-        return self.text[start:self.pos]
+        return self.buf[start:self.pos].decode('utf-8', 'replace')
 
     def parse_value(self) -> Any:
         """Parse a value (string, number, boolean, dict, or list)."""
@@ -66,82 +94,71 @@ class PDXParser:
         if self.pos >= self.length:
             return None
 
-        c = self.text[self.pos]
+        c = self.buf[self.pos]
 
-        if c == '"':
+        if c == _QUOTE:
             return self.parse_string()
-        elif c == '{':
+        elif c == _OPEN:
             return self.parse_block()
         else:
-            ident = self.parse_identifier()
-            if ident == 'yes':
-                return True
-            elif ident == 'no':
-                return False
-            # Try to parse as number
-            try:
-                if '.' in ident:
-                    return float(ident)
-                return int(ident)
-            except ValueError:
-                return ident
+            value = _coerce(self.parse_identifier())
+            # Typed blocks like `color=rgb { 20 60 200 }`: the identifier
+            # names the type of the block that follows rather than being a
+            # value itself. Stranding the block here used to loop forever
+            # in parse_dict_contents.
+            if type(value) is str and value and self.peek() == '{':
+                return self.parse_block()
+            return value
 
     def parse_block(self) -> dict | list:
         """Parse a block (either dict or list)."""
-        assert self.text[self.pos] == '{'
+        assert self.buf[self.pos] == _OPEN
         self.pos += 1
 
         self.skip_whitespace()
 
-        if self.pos >= self.length or self.text[self.pos] == '}':
+        if self.pos >= self.length:
+            return {}
+        c = self.buf[self.pos]
+        if c == _CLOSE:
             self.pos += 1
             return {}
 
-        # Check if this is a list or dict by looking for '='
-        is_dict = False
-        save_pos = self.pos
-
-        # Scan ahead to determine structure
-        depth = 0
-        temp_pos = self.pos
-        while temp_pos < self.length:
-            c = self.text[temp_pos]
-            if c == '{':
-                depth += 1
-            elif c == '}':
-                if depth == 0:
-                    break
-                depth -= 1
-            elif c == '=' and depth == 0:
-                is_dict = True
-                break
-            elif c == '"':
-                temp_pos += 1
-                while temp_pos < self.length and self.text[temp_pos] != '"':
-                    if self.text[temp_pos] == '\\':
-                        temp_pos += 1
-                    temp_pos += 1
-            temp_pos += 1
-
-        if is_dict:
-            return self.parse_dict_contents()
+        # Read one token and let the character after it decide the shape:
+        # '=' means dict, anything else means list. Replaces the old
+        # lookahead pass that scanned the whole block a second time.
+        if c == _OPEN:
+            return self.parse_list_contents([self.parse_block()])
+        if c == _QUOTE:
+            token = self.parse_string()
         else:
-            return self.parse_list_contents()
+            token = self.parse_identifier()
+
+        self.skip_whitespace()
+        if self.pos < self.length and self.buf[self.pos] == _EQ:
+            self.pos += 1
+            return self.parse_dict_contents({token: self.parse_value()})
+
+        first = token if c == _QUOTE else _coerce(token)
+        if type(first) is str and first and c != _QUOTE and self.peek() == '{':
+            first = self.parse_block()  # typed block as first list element
+        return self.parse_list_contents([first])
 
-    def parse_dict_contents(self) -> dict:
+    def parse_dict_contents(self, result: dict | None = None) -> dict:
         """Parse dictionary contents until closing brace."""
-        result = {}
+        if result is None:
+            result = {}
 
         while True:
             self.skip_whitespace()
 
-            if self.pos >= self.length or self.text[self.pos] == '}':
+            if self.pos >= self.length or self.buf[self.pos] == _CLOSE:
                 if self.pos < self.length:
                     self.pos += 1
                 break
 
             # Parse key
-            if self.text[self.pos] == '"':
+            if self.buf[self.pos] == _QUOTE:
                 key = self.parse_string()
             else:
                 key = self.parse_identifier()
@@ -149,10 +166,13 @@ class PDXParser:
             self.skip_whitespace()
 
             # Expect '='
-            if self.pos < self.length and self.text[self.pos] == '=':
+            if self.pos < self.length and self.buf[self.pos] == _EQ:
                 self.pos += 1
             else:
-                # Might be a standalone value in a mixed block
+                # Standalone token in a mixed block; always advance so
+                # malformed input can never stall the loop
+                if not key:
+                    self.pos += 1
                 continue
 
             # Parse value
@@ -168,19 +188,27 @@ class PDXParser:
 
         return result
 
-    def parse_list_contents(self) -> list:
+    def parse_list_contents(self, result: list | None = None) -> list:
         """Parse list contents until closing brace."""
-        result = []
+        if result is None:
+            result = []
 
         while True:
             self.skip_whitespace()
 
-            if self.pos >= self.length or self.text[self.pos] == '}':
+            if self.pos >= self.length or self.buf[self.pos] == _CLOSE:
                 if self.pos < self.length:
                     self.pos += 1
                 break
 
+            start = self.pos
             value = self.parse_value()
+            if self.pos == start:
+                # Stray structural byte (e.g. '=' in a mixed block);
+                # always advance so malformed input can never stall the
+                # loop — same guard as parse_dict_contents
+                self.pos += 1
+                continue
             result.append(value)
 
         return result
@@ -190,100 +218,166 @@ class PDXParser:
         return self.parse_dict_contents()
 
 
-def parse_pdx(text: str) -> dict:
+def parse_pdx(text: str | bytes) -> dict:
     """Parse PDX script format text into a Python dictionary."""
     parser = PDXParser(text)
     return parser.parse()
 
 
-def extract_section(filepath: str, section_name: str) -> str:
-    """Extract a specific top-level section from a large file efficiently."""
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_section = False
-        depth = 0
-        section_lines = []
+def _skip_value(parser: PDXParser) -> None:
+    """Advance past the next value without building Python objects."""
+    parser.skip_whitespace()
+    if parser.pos >= parser.length:
+        return
+    buf = parser.buf
+    c = buf[parser.pos]
+    if c == _QUOTE:
+        parser.parse_string()
+        return
+    if c != _OPEN:
+        # Bare token; a '{' right after means a typed block (rgb { ... })
+        while parser.pos < parser.length and not _IDENT_STOP_TABLE[buf[parser.pos]]:
+            parser.pos += 1
+        parser.skip_whitespace()
+        if parser.pos >= parser.length or buf[parser.pos] != _OPEN:
+            return
+    # Jump brace to brace over the block instead of tokenizing it
+    depth = 1
+    pos = parser.pos + 1
+    while depth:
+        opener = buf.find(b'{', pos)
+        closer = buf.find(b'}', pos)
+        if closer == -1:
+            pos = parser.length
+            break
+        if opener != -1 and opener < closer:
+            depth += 1
+            pos = opener + 1
+        else:
+            depth -= 1
+            pos = closer + 1
+    parser.pos = pos
 
-        for line in f:
-            if not in_section:
-                # Look for section start
-                if line.strip().startswith(f'{section_name}='):
-                    in_section = True
-                    section_lines.append(line)
-                    depth = line.count('{') - line.count('}')
+
+def extract_country_fields(text: str, fields: set[str]) -> dict:
+    """Parse only the named top-level fields out of a country block body.
+
+    Country entries are dominated by large subtrees the reports never
+    read; this walks the top level, fully parses a value only when its
+    key is wanted, and brace-jumps past everything else. Stops early
+    once every requested field has been seen (first occurrence wins).
+    """
+    parser = PDXParser(text)
+    buf = parser.buf
+    length = parser.length
+    result = {}
+
+    while parser.pos < length and len(result) < len(fields):
+        parser.skip_whitespace()
+        if parser.pos >= length:
+            break
+        c = buf[parser.pos]
+        if c == _CLOSE:
+            parser.pos += 1
+            continue
+
+        key = parser.parse_string() if c == _QUOTE else parser.parse_identifier()
+        parser.skip_whitespace()
+        if parser.pos < length and buf[parser.pos] == _EQ:
+            parser.pos += 1
+            if key in fields and key not in result:
+                result[key] = parser.parse_value()
             else:
-                section_lines.append(line)
-                depth += line.count('{') - line.count('}')
+                _skip_value(parser)
+        elif not key:
+            parser.pos += 1  # stray structural byte; never stall
+
+    return result
 
-                if depth <= 0:
-                    break
 
-        return ''.join(section_lines)
+def extract_section(filepath: str, section_name: str) -> str:
+    """Extract a specific top-level section from a large file efficiently."""
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        match = re.search(rb'^[ \t]*' + re.escape(section_name.encode()) + rb'=',
+                          mm, re.M)
+        if match is None:
+            return ''
+        brace = mm.find(b'{', match.end())
+        if brace == -1:
+            return ''
+        end = _skip_block_bytes(mm, brace + 1)
+        # Keep the trailing newline of the closing line, like the old
+        # line-by-line collector did
+        newline = mm.find(b'\n', end)
+        end = len(mm) if newline == -1 else newline + 1
+        return mm[match.start():end].decode('utf-8', 'replace')
+
+
+# Matches the `N={` line that opens a numbered database entry
+_ENTRY_HEADER_RE = re.compile(rb'\s*\d+=\{\s*$')
+
+
+def _skip_block_bytes(mm, start: int) -> int:
+    """Return the index just past the brace block opened before `start`.
+
+    Jumps between braces with mmap.find (memchr under the hood) instead
+    of touching every byte.
+    """
+    depth = 1
+    pos = start
+    while depth:
+        opener = mm.find(b'{', pos)
+        closer = mm.find(b'}', pos)
+        if closer == -1:
+            return len(mm)
+        if opener != -1 and opener < closer:
+            depth += 1
+            pos = opener + 1
+        else:
+            depth -= 1
+            pos = closer + 1
+    return pos
 
 
 def find_country_by_tag(filepath: str, tag: str) -> dict | None:
     """Find a country entry by its tag efficiently."""
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        in_countries = False
-        in_country = False
-        depth = 0
-        country_lines = []
-        found_tag = False
-
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-
-            if not in_country:
-                # Look for country_name="TAG"
-                if f'country_name="{tag}"' in line:
-                    # Found it - need to backtrack to find the start of this country block
-                    # We'll re-scan to get the full block
-                    found_tag = True
-                    break
-
-        if not found_tag:
+    with open(filepath, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        idx = mm.find(f'country_name="{tag}"'.encode())
+        if idx == -1:
             return None
 
-        # Now re-scan to extract the full country block
-        f.seek(0)
-        in_countries = False
-        collecting = False
-        depth = 0
-        country_lines = []
-
-        for line in f:
-            if not in_countries:
-                if line.strip().startswith('countries='):
-                    in_countries = True
-                continue
-
-            if not collecting:
-                if f'country_name="{tag}"' in line:
-                    collecting = True
-                    # Find the opening brace for this country
-                    # Go back a bit in the line buffer
-                    country_lines.append(line)
-                    depth = line.count('{') - line.count('}')
-            else:
-                country_lines.append(line)
-                depth += line.count('{') - line.count('}')
-
-                if depth <= 0:
-                    break
-
-        if country_lines:
-            # Extract just the content after country_name
-            text = ''.join(country_lines)
-            return parse_pdx(text)
-
-    return None
-
-
-def stream_countries(filepath: str) -> Iterator[tuple[str, dict]]:
-    """Stream through all countries, yielding (tag, data) pairs."""
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        # Walk back line by line to the `N={` header opening this entry
+        pos = idx
+        while True:
+            newline = mm.rfind(b'\n', 0, pos)
+            if newline == -1:
+                return None
+            line_start = newline + 1
+            if _ENTRY_HEADER_RE.match(mm, line_start, pos):
+                break
+            pos = newline
+
+        # Parse just the entry body, between its braces
+        brace = mm.find(b'{', line_start)
+        end = _skip_block_bytes(mm, brace + 1)
+        text = mm[brace + 1:end - 1].decode('utf-8', 'replace')
+        return parse_pdx(text)
+
+
+def stream_countries(filepath: str, wanted: set[str] | None = None) -> Iterator[tuple[str, dict]]:
+    """Stream through all countries, yielding (tag, data) pairs.
+
+    Pass `wanted` to yield only those tags and stop scanning as soon as
+    the last of them has been collected; unwanted blocks are skipped
+    without being parsed at all.
+    """
+    if wanted is not None:
+        wanted = set(wanted)  # consumed below; don't eat the caller's set
+    # Binary scan with a 4 MiB buffer: no per-line UTF-8 decode, no
+    # syscall per 8 KiB; only yielded blocks ever reach the parser
+    with open(filepath, 'rb', buffering=1 << 22) as f:
         in_countries = False
         in_database = False
         in_country = False
@@ -293,48 +387,115 @@ def stream_countries(filepath: str) -> Iterator[tuple[str, dict]]:
 
         for line in f:
             if not in_countries:
-                if line.strip().startswith('countries='):
+                if line.strip().startswith(b'countries='):
                     in_countries = True
                 continue
 
             if not in_database:
-                if line.strip().startswith('database='):
+                if line.strip().startswith(b'database='):
                     in_database = True
                 continue
 
             if not in_country:
                 # Look for a new country entry (number={)
                 stripped = line.strip()
-                if stripped and stripped[0].isdigit() and '={' in stripped:
+                if stripped and stripped[0:1].isdigit() and b'={' in stripped:
                     in_country = True
                     country_lines = [line]
-                    depth = line.count('{') - line.count('}')
+                    depth = line.count(b'{') - line.count(b'}')
                     current_tag = None
             else:
                 country_lines.append(line)
-                depth += line.count('{') - line.count('}')
+                depth += line.count(b'{') - line.count(b'}')
 
-                # Extract tag if we see it
-                if current_tag is None and 'country_name="' in line:
-                    match = re.search(r'country_name="(\w+)"', line)
-                    if match:
-                        current_tag = match.group(1)
+                # Extract tag if we see it; the token is fixed-format, so
+                # two partitions beat invoking the regex engine
+                if current_tag is None:
+                    after = line.partition(b'country_name="')[2]
+                    if after:
+                        tag = after.partition(b'"')[0]
+                        if tag.isalnum():
+                            current_tag = tag.decode()
 
                 if depth <= 0:
                     # End of country block
-                    if current_tag and country_lines:
-                        text = ''.join(country_lines)
+                    if current_tag and country_lines and \
+                            (wanted is None or current_tag in wanted):
                         try:
-                            data = parse_pdx(text)
+                            data = parse_pdx(b''.join(country_lines))
                             yield (current_tag, data)
                         except Exception:
                             pass  # Skip malformed entries
+                        if wanted is not None:
+                            wanted.discard(current_tag)
+                            if not wanted:
+                                return
 
                     in_country = False
                     country_lines = []
                     current_tag = None
 
 
+def stream_characters(filepath: str, wanted: set[int] | None = None) -> Iterator[tuple[int, dict]]:
+    """Stream characters from character_db, yielding (id, data) pairs.
+
+    Pass `wanted` to yield only those ids and stop scanning as soon as
+    the last of them has been seen — ruler and regent lookups for every
+    player then cost one partial pass instead of a scan per character.
+    """
+    if wanted is not None:
+        wanted = set(wanted)  # consumed below; don't eat the caller's set
+    # Binary scan, same shape as stream_countries
+    with open(filepath, 'rb', buffering=1 << 22) as f:
+        in_section = False
+        in_database = False
+        in_char = False
+        depth = 0
+        char_lines = []
+        current_id = None
+
+        for line in f:
+            if not in_section:
+                if line.strip().startswith(b'character_db='):
+                    in_section = True
+                continue
+
+            if not in_database:
+                if line.strip().startswith(b'database='):
+                    in_database = True
+                continue
+
+            if not in_char:
+                stripped = line.strip()
+                if stripped == b'}':
+                    break  # database block closed
+                if stripped and stripped[0:1].isdigit() and b'={' in stripped:
+                    key = stripped.partition(b'=')[0]
+                    if key.isdigit():
+                        current_id = int(key)
+                        in_char = True
+                        char_lines = [line]
+                        depth = line.count(b'{') - line.count(b'}')
+            else:
+                char_lines.append(line)
+                depth += line.count(b'{') - line.count(b'}')
+
+                if depth <= 0:
+                    if wanted is None or current_id in wanted:
+                        try:
+                            data = parse_pdx(b''.join(char_lines))
+                            yield (current_id, data.get(str(current_id), data))
+                        except Exception:
+                            pass  # Skip malformed entries
+                        if wanted is not None:
+                            wanted.discard(current_id)
+                            if not wanted:
+                                return
+                    in_char = False
+                    char_lines = []
+                    current_id = None
+
+
 if __name__ == '__main__':
     # Test with a small sample
     sample = '''